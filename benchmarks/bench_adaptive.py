@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stronghold2_patcher import Stronghold2Worker, MODULE_NAME, POINTER_OFFSET, ADDRESS_OFFSET
+import standin
+
+ROOT = f"[{MODULE_NAME}+0x{POINTER_OFFSET:x}]"
+FLAG = {"name": "ai_enabled", "chain": f"{ROOT}+0x{ADDRESS_OFFSET:x}", "type": "u8", "value": 1}
+LOBBY = {"name": "in_lobby", "chain": f"{ROOT}+0x{standin.LOBBY_OFFSET:x}", "type": "u8", "value": 1,
+         "mode": "lobby", "rate": 2}
+
+def cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def collect(child, events):
+    for line in child.stdout:
+        event = json.loads(line)
+        events.append((event['event'], event['time']))
+
+def reactions(events, lobby_only):
+    results = []
+    reset = None
+    in_lobby = True
+    for event, when in events:
+        if event == "phase":
+            in_lobby = not in_lobby
+        elif event == "reset":
+            reset = when if in_lobby or not lobby_only else None
+        elif event == "patched" and reset is not None:
+            results.append((when - reset) * 1000)
+            reset = None
+    return results
+
+def measure(path, table, args):
+    with open(path, 'w') as f:
+        json.dump(table, f)
+    children = standin.spawn(1, reset_interval=args.lobby_reset_interval, watch=0.001, lobby_time=args.lobby_time,
+                             match_time=args.match_time, match_reset_interval=args.match_reset_interval)
+    events = []
+    reader = threading.Thread(target=collect, args=(children[0][0], events), daemon=True)
+    reader.start()
+    try:
+        worker = Stronghold2Worker(patch_path=path)
+        cpu_start = cpu_time()
+        worker.start()
+        time.sleep(args.duration)
+        worker.stop()
+        worker.wait()
+        cpu = cpu_time() - cpu_start
+    finally:
+        standin.terminate(children)
+        reader.join()
+    return (cpu / args.duration, worker.metrics.counters["ticks"] / args.duration, reactions(events, False),
+            reactions(events, True))
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU versus reaction time of fixed and adaptive patch rates")
+    parser.add_argument('--duration', type=float, default=60.0)
+    parser.add_argument('--lobby-time', type=float, default=10.0)
+    parser.add_argument('--match-time', type=float, default=20.0)
+    parser.add_argument('--lobby-reset-interval', type=float, default=1.3)
+    parser.add_argument('--match-reset-interval', type=float, default=7.0)
+    parser.add_argument('--min-rate', type=float, default=0.5)
+    parser.add_argument('--max-rate', type=float, default=10.0)
+    args = parser.parse_args()
+
+    bounds = {"min_rate": args.min_rate, "max_rate": args.max_rate}
+    configs = [
+        (f"fixed {args.min_rate:g} Hz", [dict(FLAG, rate=args.min_rate)]),
+        ("fixed 1 Hz", [dict(FLAG, rate=1)]),
+        (f"fixed {args.max_rate:g} Hz", [dict(FLAG, rate=args.max_rate)]),
+        ("adaptive", [dict(FLAG, **bounds)]),
+        ("adaptive+phase", [dict(FLAG, **bounds), LOBBY]),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "patches.json")
+        for label, table in configs:
+            cpu, ticks, delays, lobby = measure(path, table, args)
+            if not delays or not lobby:
+                print(f"{label:15} no resets observed")
+                continue
+            delays.sort()
+            print(f"{label:15} cpu {cpu * 1000:7.2f} ms/s  ticks {ticks:6.2f}/s  reaction p50 "
+                  f"{statistics.median(delays):8.1f} ms  p95 {delays[int(len(delays) * 0.95)]:8.1f} ms  "
+                  f"lobby p50 {statistics.median(lobby):8.1f} ms  ({len(delays)} resets)")
+
+if __name__ == "__main__":
+    main()
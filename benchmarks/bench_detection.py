@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stronghold2_patcher import Stronghold2Worker, MODULE_NAME
+
+RENAMED = (
+    "import ctypes, time\n"
+    "time.sleep(0.05)\n"
+    "ctypes.CDLL(None).prctl(15, b'Stronghold2.exe', 0, 0, 0)\n"
+    "time.sleep(3600)\n"
+)
+
+async def watch(worker, result):
+    start_cpu = time.thread_time()
+    worker.sync_targets()
+    while worker.running and not worker.targets:
+        if 'spawned' not in result:
+            result['idle_cpu'] = time.thread_time() - start_cpu
+        if await worker.wait_events(2) or worker.needs_polling():
+            worker.sync_targets()
+    if worker.targets:
+        result['detected'] = time.perf_counter()
+        result['pid'] = next(iter(worker.targets))
+
+def detect(worker, result, ready):
+    worker.loop = asyncio.new_event_loop()
+    worker.open_connector()
+    ready.set()
+    try:
+        worker.loop.run_until_complete(watch(worker, result))
+    finally:
+        for pid in list(worker.targets):
+            worker.remove_target(pid)
+        worker.close_connector()
+        worker.loop.close()
+        worker.loop = None
+
+def measure(use_proc_connector, command, idle):
+    worker = Stronghold2Worker(use_proc_connector=use_proc_connector)
+    worker.running = True
+    result = {}
+    ready = threading.Event()
+    thread = threading.Thread(target=detect, args=(worker, result, ready))
+    thread.start()
+    ready.wait()
+    mode = "proc connector" if worker.connector else "/proc polling"
+    time.sleep(idle)
+    result['spawned'] = time.perf_counter()
+    child = subprocess.Popen(command)
+    thread.join(10)
+    worker.stop()
+    thread.join()
+    child.kill()
+    child.wait()
+    latency = result.get('detected', float('nan')) - result['spawned']
+    return mode, latency, result.get('idle_cpu', 0.0), result.get('pid') == child.pid
+
+def main():
+    parser = argparse.ArgumentParser(description="Game launch detection latency: proc connector vs /proc polling")
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--idle', type=float, default=3.0, help="seconds to wait before launching the stand-in")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        exe = os.path.join(directory, MODULE_NAME)
+        shutil.copy(shutil.which('sleep'), exe)
+        launches = [
+            ("exec", [exe, '3600']),
+            ("prctl rename", [sys.executable, '-c', RENAMED]),
+        ]
+        for use_proc_connector in (True, False):
+            for label, command in launches:
+                for _ in range(args.rounds):
+                    mode, latency, idle_cpu, ok = measure(use_proc_connector, command, args.idle)
+                    print(f"{mode:15} {label:13} latency {latency * 1000:8.2f} ms  "
+                          f"cpu before launch {idle_cpu * 1000:6.2f} ms  {'ok' if ok else 'MISSED'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stronghold2_patcher import ProcessScanner, MODULE_NAME
+
+STAND_IN = (
+    "import ctypes, time\n"
+    "ctypes.CDLL(None).prctl(15, b'Stronghold2.exe', 0, 0, 0)\n"
+    "time.sleep(3600)\n"
+)
+
+def pgrep_scan():
+    result = subprocess.run(['pgrep', '-f', MODULE_NAME], capture_output=True, text=True)
+    if result.returncode != 0:
+        return []
+    return [int(pid) for pid in result.stdout.split() if pid.isdigit()]
+
+def measure(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return result, samples[len(samples) // 2], samples[-1]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare pgrep against the /proc discovery engine")
+    parser.add_argument('--fillers', type=int, default=3000, help="number of idle filler processes to spawn")
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    children = []
+    try:
+        for _ in range(args.fillers):
+            children.append(subprocess.Popen(['sleep', '3600']))
+        children.append(subprocess.Popen(['sh', '-c', f'sleep 3600; : {MODULE_NAME}']))
+        children.append(subprocess.Popen([sys.executable, '-c', STAND_IN]))
+        time.sleep(1)
+
+        total = sum(1 for entry in os.listdir('/proc') if entry.isdigit())
+        print(f"processes on system: {total}")
+
+        pids, median, worst = measure(pgrep_scan, args.rounds)
+        print(f"pgrep -f        median {median * 1000:8.3f} ms  max {worst * 1000:8.3f} ms  matches {pids}")
+
+        scanner = ProcessScanner()
+        start = time.perf_counter()
+        pids = scanner.scan()
+        cold = time.perf_counter() - start
+        print(f"/proc cold scan        {cold * 1000:8.3f} ms  inspections {scanner.inspections}  matches {pids}")
+
+        time.sleep(6)
+        scanner.inspections = 0
+        pids, median, worst = measure(scanner.scan, args.rounds)
+        print(f"/proc warm scan median {median * 1000:8.3f} ms  max {worst * 1000:8.3f} ms  "
+              f"inspections/scan {scanner.inspections / args.rounds:.1f}  matches {pids}")
+    finally:
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+if __name__ == "__main__":
+    main()
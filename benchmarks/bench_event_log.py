@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stronghold2_patcher import EventLog
+
+def emit_cost(log, count):
+    start = time.perf_counter()
+    for index in range(count):
+        log.emit("warning", "read_failed", pid=1234, address=0x40000d28 + index, size=1)
+    return (time.perf_counter() - start) / count * 1e9
+
+def drain_cost(log, count, batch=1000):
+    elapsed = 0.0
+    for _ in range(count // batch):
+        for _ in range(batch):
+            log.emit("info", "patch_written", pid=1234, name="ai_enabled", address=0x40000d28)
+        start = time.perf_counter()
+        log.drain()
+        elapsed += time.perf_counter() - start
+    return elapsed / (count // batch * batch) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description="Event log emit, drain and viewer polling costs")
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "events.log")
+        print(f"emit                 {emit_cost(EventLog(), args.count):8.1f} ns/event")
+        print(f"drain to ring        {drain_cost(EventLog(), args.count):8.1f} ns/event")
+        log = EventLog(path, max_bytes=1 << 20)
+        print(f"drain to file sink   {drain_cost(log, args.count):8.1f} ns/event  "
+              f"({len(os.listdir(directory))} files after rotation)")
+        log.close()
+
+        start = time.perf_counter()
+        for _ in range(100):
+            log.since(log.sequence - 50)
+        print(f"viewer poll          {(time.perf_counter() - start) / 100 * 1e6:8.1f} us "
+              f"({len(log.entries)} entries in ring)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stronghold2_patcher import Stronghold2Worker, MODULE_NAME, POINTER_OFFSET
+import standin
+
+class CountingWorker(Stronghold2Worker):
+
+    def __init__(self, patch_path):
+        super().__init__(patch_path=patch_path)
+        self.waits = 0
+
+    async def wait_events(self, timeout):
+        self.waits += 1
+        return await super().wait_events(timeout)
+
+def cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def write_table(path, count, rate):
+    entries = [{
+        "name": f"value_{index}",
+        "chain": f"[{MODULE_NAME}+0x{POINTER_OFFSET:x}]+0x{0x100 + index:x}",
+        "type": "u8",
+        "value": 1,
+        "mode": "enforce",
+        "rate": rate,
+    } for index in range(count)]
+    with open(path, 'w') as f:
+        json.dump(entries, f)
+
+def measure(path, count, rate, duration):
+    write_table(path, count, rate)
+    worker = CountingWorker(path)
+    worker.start()
+    while not worker.targets:
+        time.sleep(0.01)
+    time.sleep(0.5)
+
+    target = next(iter(worker.targets.values()))
+    checks_start = sum(state.stats.checks for state in target.patches.values())
+    ticks_start = worker.metrics.counters["ticks"]
+    waits_start = worker.waits
+    cpu_start = cpu_time()
+    time.sleep(duration)
+    cpu = cpu_time() - cpu_start
+    checks = sum(state.stats.checks for state in target.patches.values()) - checks_start
+    ticks = worker.metrics.counters["ticks"] - ticks_start
+    waits = worker.waits - waits_start
+    worker.stop()
+    worker.wait()
+    return {
+        "cpu": cpu / duration,
+        "achieved": checks / duration / count,
+        "wakeups": waits / duration,
+        "batch": checks / ticks if ticks else 0.0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Freeze scheduler cost versus number of frozen values and rate")
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 16, 128])
+    parser.add_argument('--rates', type=float, nargs='+', default=[1, 10, 100])
+    args = parser.parse_args()
+
+    children = standin.spawn(1)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "patches.json")
+            for rate in args.rates:
+                for count in args.counts:
+                    result = measure(path, count, rate, args.duration)
+                    print(f"{count:4} values @ {rate:6.1f} Hz  cpu {result['cpu'] * 1000:8.2f} ms/s  "
+                          f"achieved {result['achieved']:7.2f} Hz  wakeups {result['wakeups']:7.1f}/s  "
+                          f"values per batch {result['batch']:6.1f}")
+    finally:
+        standin.terminate(children)
+
+if __name__ == "__main__":
+    main()
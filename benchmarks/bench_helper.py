@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stronghold2_patcher import HelperClient, ProcessScanner, create_memory_backend
+import standin
+
+def timed(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+def memory_status(pid):
+    values = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('VmRSS', 'VmHWM'):
+                values[key] = value.strip()
+    return values
+
+def main():
+    parser = argparse.ArgumentParser(description="Round-trip latency and footprint of the privileged helper")
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+
+    children = standin.spawn(1)
+    pid, flag = children[0][1]['pid'], children[0][1]['flag']
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'helper.sock')
+        helper = subprocess.Popen([sys.executable, os.path.join(ROOT, 'stronghold2_patcher.py'),
+                                   '--helper', path, '--helper-parent', str(os.getpid())])
+        try:
+            client = HelperClient(path, timeout=10)
+            client.scan()
+            scanner = ProcessScanner()
+            scanner.scan()
+            start_time = scanner.start_time(pid)
+            direct = create_memory_backend()
+
+            for fields in (1, 16, 256):
+                reads = [(flag, 1)] * fields
+                writes = [(flag, b'\x01')] * fields
+                rows = [
+                    ("in-process read", lambda: direct.read_batch(pid, reads, start_time)),
+                    ("helper read", lambda: client.read_batch(pid, reads)),
+                    ("in-process write", lambda: direct.write_batch(pid, writes, start_time)),
+                    ("helper write", lambda: client.write_batch(pid, writes)),
+                ]
+                for label, func in rows:
+                    iterations = max(args.iterations // fields, 50)
+                    print(f"{fields:3} fields {label:17} {timed(func, iterations) * 1e6:9.2f} us/batch")
+
+            client.close()
+            print(f"helper memory: {memory_status(helper.pid)}")
+        finally:
+            helper.terminate()
+            helper.wait()
+            standin.terminate(children)
+
+if __name__ == "__main__":
+    main()
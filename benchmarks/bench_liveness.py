@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stronghold2_patcher
+from stronghold2_patcher import Stronghold2Worker, RETRY_MIN_INTERVAL, RETRY_INTERVAL
+import standin
+
+def collect(child, events):
+    for line in child.stdout:
+        event = json.loads(line)
+        events.append((event['event'], event['time']))
+
+def measure(duration, move_interval, move_gap, retry_min):
+    stronghold2_patcher.RETRY_MIN_INTERVAL = retry_min
+    children = standin.spawn(1, watch=0.001, move_interval=move_interval, move_gap=move_gap)
+    events = []
+    reader = threading.Thread(target=collect, args=(children[0][0], events), daemon=True)
+    reader.start()
+    try:
+        worker = Stronghold2Worker()
+        worker.start()
+        time.sleep(duration)
+        worker.stop()
+        worker.wait()
+    finally:
+        standin.terminate(children)
+        reader.join()
+
+    reactions = []
+    attached = None
+    for event, when in events:
+        if event == "attached":
+            attached = when
+        elif event == "patched" and attached is not None:
+            reactions.append((when - attached) * 1000)
+            attached = None
+    stale = sum(1 for event, _ in events if event == "stale")
+    return reactions, stale, worker.metrics.counters["pointer_moves"]
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-resolution latency when the flag struct moves behind the root pointer")
+    parser.add_argument('--duration', type=float, default=30.0)
+    parser.add_argument('--move-interval', type=float, default=2.5)
+    parser.add_argument('--move-gap', type=float, default=0.3, help="seconds the root pointer stays null")
+    args = parser.parse_args()
+
+    for label, retry_min in (("fixed retry", RETRY_INTERVAL), ("backoff", RETRY_MIN_INTERVAL)):
+        reactions, stale, moves = measure(args.duration, args.move_interval, args.move_gap, retry_min)
+        if not reactions:
+            print(f"{label:12} no re-attachments observed")
+            continue
+        print(f"{label:12} re-patch after attach  p50 {statistics.median(reactions):8.2f} ms  "
+              f"max {max(reactions):8.2f} ms  moves {len(reactions):3} (seen {moves})  stale writes {stale}")
+
+if __name__ == "__main__":
+    main()
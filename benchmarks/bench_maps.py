@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stronghold2_patcher import MemoryMap, MODULE_NAME
+
+MODULE_PATH = f"/home/user/.steam/steam/steamapps/common/Stronghold 2/{MODULE_NAME}"
+
+def synthetic_maps(regions):
+    lines = []
+    address = 0x10000
+    for index in range(regions):
+        size = random.choice((0x1000, 0x10000, 0x100000))
+        if index == regions // 2:
+            name, perms = MODULE_PATH, 'r-xp'
+        elif index % 7 == 0:
+            name, perms = f"/usr/lib/wine/x86_64-unix/lib{index}.so", 'r--p'
+        else:
+            name, perms = '', 'rw-p'
+        lines.append(f"{address:08x}-{address + size:08x} {perms} 00000000 00:00 0 {name}".rstrip())
+        address += size + random.choice((0, 0x1000))
+    return '\n'.join(lines) + '\n'
+
+def line_scan_base(text, module=MODULE_NAME):
+    for line in text.splitlines():
+        if module in line and 'r-xp' in line:
+            return int(line.split()[0].split('-')[0], 16)
+    return 0
+
+def line_scan_mapped(text, address):
+    for line in text.splitlines():
+        start, end = line.split()[0].split('-')
+        if int(start, 16) <= address < int(end, 16):
+            return 'r' in line.split()[1]
+    return False
+
+def measure(func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare line-by-line maps parsing against the indexed MemoryMap")
+    parser.add_argument('--regions', type=int, default=4000)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(1)
+    text = synthetic_maps(args.regions)
+    maps = MemoryMap(text)
+    reread = text.encode().decode()
+    assert maps.module_base(MODULE_NAME) == line_scan_base(text)
+    probes = [random.randrange(maps.starts[0], maps.ends[-1]) for _ in range(args.rounds)]
+    probe = iter(probes * 2)
+
+    print(f"{len(maps)} regions, {len(text)} bytes")
+    print(f"line scan base address   {measure(lambda: line_scan_base(text), args.rounds):9.2f} us")
+    print(f"line scan mapped lookup  {measure(lambda: line_scan_mapped(text, next(probe)), args.rounds):9.2f} us")
+    print(f"index build              {measure(lambda: MemoryMap(text), args.rounds):9.2f} us")
+    print(f"unchanged check          {measure(lambda: maps.text == reread, args.rounds):9.2f} us")
+    print(f"index base address       {measure(lambda: maps.module_base(MODULE_NAME), args.rounds * 100):9.2f} us")
+    probe = iter(probes * 200)
+    print(f"index mapped lookup      {measure(lambda: maps.mapped(next(probe)), args.rounds * 100):9.2f} us")
+
+    with open(f"/proc/{os.getpid()}/maps") as f:
+        live = MemoryMap(f.read())
+    address = id(maps)
+    print(f"self check: {address:#x} mapped={live.mapped(address, 8)} region={live.region(live.find(address))[:3]}")
+
+if __name__ == "__main__":
+    main()
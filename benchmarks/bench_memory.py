@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stronghold2_patcher import MemoryHandlePool, ProcessScanner, VectoredMemory, load_vm_syscalls
+
+TARGET = (
+    "import ctypes, time\n"
+    "buf = ctypes.create_string_buffer(1 << 16)\n"
+    "print(ctypes.addressof(buf), flush=True)\n"
+    "time.sleep(3600)\n"
+)
+
+def open_per_call_read(pid, address, size):
+    with open(f"/proc/{pid}/mem", 'rb') as mem_file:
+        mem_file.seek(address)
+        return mem_file.read(size)
+
+def open_per_call_write(pid, address, data):
+    with open(f"/proc/{pid}/mem", 'wb') as mem_file:
+        mem_file.seek(address)
+        mem_file.write(data)
+        return True
+
+def timed(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare /proc/<pid>/mem access strategies and the process_vm backend")
+    parser.add_argument('--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    child = subprocess.Popen([sys.executable, '-c', TARGET], stdout=subprocess.PIPE, text=True)
+    try:
+        address = int(child.stdout.readline())
+        pid = child.pid
+        start_time = ProcessScanner().read_start_time(pid)
+        pool = MemoryHandlePool()
+
+        rows = [
+            ("open per call read 4B", lambda: open_per_call_read(pid, address, 4)),
+            ("pool pread 4B", lambda: pool.read(pid, address, 4, start_time)),
+            ("open per call write 1B", lambda: open_per_call_write(pid, address, b'\x01')),
+            ("pool pwrite 1B", lambda: pool.write(pid, address, b'\x01', start_time)),
+        ]
+        for label, func in rows:
+            print(f"{label:24} {timed(func, args.iterations) * 1e6:8.2f} us/op")
+        print(f"pool counters: {pool.stats()}")
+
+        syscalls = load_vm_syscalls()
+        if syscalls is None:
+            print("process_vm_readv/process_vm_writev unavailable, skipping batch comparison")
+        else:
+            vectored = VectoredMemory(MemoryHandlePool(), syscalls, min_batch=1)
+            iterations = max(args.iterations // 20, 1)
+            for fields in (1, 16, 256):
+                reads = [(address + i * 8, 4) for i in range(fields)]
+                writes = [(address + i * 8, b'\x01') for i in range(fields)]
+                rows = [
+                    ("proc_mem read", lambda: pool.read_batch(pid, reads, start_time)),
+                    ("process_vm read", lambda: vectored.read_batch(pid, reads, start_time)),
+                    ("proc_mem write", lambda: pool.write_batch(pid, writes, start_time)),
+                    ("process_vm write", lambda: vectored.write_batch(pid, writes, start_time)),
+                ]
+                for label, func in rows:
+                    print(f"{fields:3} fields {label:16} {timed(func, iterations) * 1e6:9.2f} us/batch")
+            print(f"vectored counters: {vectored.stats()}")
+            vectored.close_all()
+        pool.close_all()
+    finally:
+        child.kill()
+        child.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import argparse
+import resource
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stronghold2_patcher import Stronghold2Worker
+import standin
+
+def cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def measure(count, duration, reset_interval):
+    children = standin.spawn(count, reset_interval)
+    try:
+        worker = Stronghold2Worker()
+        cpu_start = cpu_time()
+        worker.start()
+        time.sleep(duration)
+        worker.stop()
+        worker.wait()
+        return cpu_time() - cpu_start, worker.memory.stats()
+    finally:
+        standin.terminate(children)
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker cost with many concurrent Stronghold2.exe stand-ins")
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--reset-interval', type=float, default=0.5)
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 8, 32])
+    args = parser.parse_args()
+
+    for count in args.counts:
+        cpu, stats = measure(count, args.duration, args.reset_interval)
+        io_calls = stats['reads'] + stats['writes'] + stats.get('vm_calls', 0)
+        print(f"{count:3} targets  cpu {cpu / args.duration * 1000:7.2f} ms/s  "
+              f"({cpu / args.duration / count * 1000:6.3f} ms/s per target)  "
+              f"memory io {io_calls / args.duration:8.1f}/s  writes {stats['writes']}  "
+              f"opens {stats['opens']}  errors {stats['errors']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stronghold2_patcher import ChainResolver, compile_chain, MODULE_NAME, A_BYTES, VM_BATCH_MIN
+
+MODULE_BASE = 0x400000
+
+class FakeProcess:
+
+    def __init__(self, levels):
+        self.memory = {}
+        self.reads = 0
+        self.round_trips = 0
+        self.vm_calls = 0
+        offsets = [0x100 + level * 8 for level in range(levels + 1)]
+        slot = MODULE_BASE + offsets[0]
+        for level in range(levels):
+            target = 0x10000000 + level * 0x10000
+            self.memory[slot] = target
+            slot = target + offsets[level + 1]
+        expression = f"{MODULE_NAME}+0x{offsets[0]:x}"
+        for offset in offsets[1:]:
+            expression = f"[{expression}]+0x{offset:x}"
+        self.expression = expression
+
+    def get_base_address(self, pid, module=MODULE_NAME):
+        return MODULE_BASE
+
+    def is_mapped(self, pid, address, size=1, perms='r'):
+        return True
+
+    def reset(self):
+        self.reads = self.round_trips = self.vm_calls = 0
+
+    def lookup(self, address, size):
+        self.reads += 1
+        value = self.memory.get(address)
+        return None if value is None else value.to_bytes(size, 'little')
+
+    def read_memory(self, pid, address, size):
+        self.round_trips += 1
+        self.vm_calls += 1
+        return self.lookup(address, size)
+
+    def read_memory_batch(self, pid, requests):
+        self.round_trips += 1
+        self.vm_calls += 1 if len(requests) >= VM_BATCH_MIN else len(requests)
+        return [self.lookup(address, size) for address, size in requests]
+
+def naive_resolve(process, chain):
+    address = process.get_base_address(0) + chain.offsets[0]
+    for offset in chain.offsets[1:]:
+        data = process.read_memory(0, address, A_BYTES)
+        address = int.from_bytes(data, 'little') + offset
+    return address
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend I/O per tick for naive and cached pointer chain resolution")
+    parser.add_argument('--ticks', type=int, default=10000)
+    args = parser.parse_args()
+
+    for levels in (1, 2, 4, 8):
+        process = FakeProcess(levels)
+        chain = compile_chain(process.expression)
+
+        start = time.perf_counter()
+        for _ in range(args.ticks):
+            naive = naive_resolve(process, chain)
+        naive_time = time.perf_counter() - start
+        naive_reads = process.reads / args.ticks
+
+        process.reset()
+        resolver = ChainResolver(chain, process, 0)
+        start = time.perf_counter()
+        for _ in range(args.ticks):
+            cached = resolver.resolve()
+        cached_time = time.perf_counter() - start
+        assert cached == naive
+
+        print(f"{levels} levels  naive {naive_reads:5.2f} calls {naive_time / args.ticks * 1e6:6.2f} us  "
+              f"cached {process.reads / args.ticks:5.2f} preads {process.vm_calls / args.ticks:5.2f} process_vm "
+              f"{process.round_trips / args.ticks:5.2f} helper calls {cached_time / args.ticks * 1e6:6.2f} us  per tick")
+
+if __name__ == "__main__":
+    main()
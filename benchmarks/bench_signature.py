@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stronghold2_patcher
+from stronghold2_patcher import MODULE_NAME, SCAN_PARALLEL_MIN, read_module_regions, scan_module
+
+PATTERN = "8B 0D * * * * 85 C9 74 ?? 8A 81"
+PLANTED = bytes.fromhex("8B0D") + (0x12345678).to_bytes(4, 'little') + bytes.fromhex("85C974108A81")
+
+TARGET = (
+    "import mmap, sys, time\n"
+    "f = open(sys.argv[1], 'rb')\n"
+    "image = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ | mmap.PROT_EXEC, flags=mmap.MAP_PRIVATE)\n"
+    "print('ready', flush=True)\n"
+    "time.sleep(3600)\n"
+)
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a wildcard signature scan over a fake module image")
+    parser.add_argument('--size', type=int, default=32, help="image size in MiB")
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    size = args.size << 20
+    rng = random.Random(0)
+    image = bytearray(rng.randbytes(size))
+    for offset in (size // 3, size - 4096):
+        image[offset:offset + len(PLANTED)] = PLANTED
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, MODULE_NAME)
+        with open(path, 'wb') as f:
+            f.write(image)
+        del image
+
+        child = subprocess.Popen([sys.executable, '-c', TARGET, path], stdout=subprocess.PIPE, text=True)
+        try:
+            child.stdout.readline()
+            regions = read_module_regions(child.pid)
+            print(f"executable regions: {[(hex(start), hex(end)) for start, end in regions]}")
+            if size < SCAN_PARALLEL_MIN:
+                print(f"image is below SCAN_PARALLEL_MIN ({SCAN_PARALLEL_MIN >> 20} MiB), "
+                      f"the patcher scans it serially; the parallel row is forced")
+
+            stronghold2_patcher.SCAN_PARALLEL_MIN = 0
+            workers = max(os.cpu_count() or 1, 2)
+            for label, count in (("serial", 1), (f"parallel x{workers}", workers)):
+                samples = []
+                for _ in range(args.rounds):
+                    start = time.perf_counter()
+                    matches = scan_module(child.pid, PATTERN, workers=count)
+                    samples.append(time.perf_counter() - start)
+                samples.sort()
+                rate = size / samples[len(samples) // 2] / (1 << 20)
+                print(f"{label:12}  median {samples[len(samples) // 2] * 1000:8.2f} ms  "
+                      f"{rate:8.0f} MiB/s  matches {[hex(match - regions[0][0]) for match in matches]}")
+        finally:
+            child.kill()
+            child.wait()
+
+if __name__ == "__main__":
+    main()
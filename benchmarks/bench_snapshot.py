@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import random
+import itertools
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stronghold2_patcher import (Stronghold2Worker, ChainResolver, compile_chain, capture_snapshot,
+                                 build_pointer_map, MODULE_NAME, POINTER_OFFSET, ADDRESS_OFFSET)
+import standin
+
+def measure(func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+def profile(worker, pid, addresses, rounds):
+    reads = itertools.cycle(addresses)
+    read = measure(lambda: worker.read_memory(pid, next(reads), 8), rounds)
+
+    chain = compile_chain(f"[{MODULE_NAME}+0x{POINTER_OFFSET:x}]+0x{ADDRESS_OFFSET:x}")
+    resolve = measure(lambda: ChainResolver(chain, worker, pid).resolve(), max(1, rounds // 100))
+
+    start = time.perf_counter()
+    pointer_map = build_pointer_map(worker, pid)
+    build = time.perf_counter() - start
+    return read, resolve, build, len(pointer_map.values) if pointer_map else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Live memory versus an mmap-backed snapshot of the same process")
+    parser.add_argument('--rounds', type=int, default=20000)
+    args = parser.parse_args()
+
+    children = standin.spawn(1)
+    try:
+        pid = children[0][1]["pid"]
+        live = Stronghold2Worker(use_proc_connector=False)
+        live.scanner.scan()
+        maps = live.refresh_maps(pid)
+        random.seed(1)
+        writable = [maps.region(index) for index in range(len(maps)) if 'w' in maps.perms[index]]
+        addresses = [random.randrange(start, end - 8) for start, end, _, _ in random.choices(writable, k=1024)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "standin.sh2s")
+            start = time.perf_counter()
+            regions, size = capture_snapshot(live, pid, path)
+            capture = time.perf_counter() - start
+            print(f"capture          {capture * 1000:9.1f} ms  {regions} runs, {size / (1 << 20):.1f} MiB "
+                  f"({os.path.getsize(path) / (1 << 20):.1f} MiB on disk)")
+
+            offline = Stronghold2Worker(snapshot_path=path)
+            offline.scanner.scan()
+            for name, worker in (("live", live), ("snapshot", offline)):
+                read, resolve, build, pointers = profile(worker, pid, addresses, args.rounds)
+                print(f"{name:9} read {read:7.2f} us  resolve {resolve:8.2f} us  "
+                      f"pointer map {build * 1000:8.1f} ms ({pointers} pointers)")
+            live.memory.close_all()
+    finally:
+        standin.terminate(children)
+
+if __name__ == "__main__":
+    main()
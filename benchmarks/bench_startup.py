@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+import importlib.util
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PATCHER = os.path.join(ROOT, 'stronghold2_patcher.py')
+
+PROBES = [
+    ("import core", [sys.executable, '-c', 'import stronghold2_patcher']),
+    ("--once", [sys.executable, PATCHER, '--once']),
+    ("import gui", [sys.executable, '-c', 'import stronghold2_gui']),
+]
+
+def measure(command, rounds):
+    samples = []
+    peak = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        pid = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).pid
+        _, status, usage = os.wait4(pid, 0)
+        samples.append(time.perf_counter() - start)
+        peak = max(peak, usage.ru_maxrss)
+    samples.sort()
+    return samples[len(samples) // 2], peak, os.waitstatus_to_exitcode(status)
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time and peak RSS of the headless and GUI paths")
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+
+    for label, command in PROBES:
+        if label == "import gui" and importlib.util.find_spec('PyQt5') is None:
+            print(f"{label:12} skipped, PyQt5 is not installed")
+            continue
+        median, peak, code = measure(command, args.rounds)
+        print(f"{label:12} median {median * 1000:8.2f} ms  peak rss {peak / 1024:7.1f} MiB  exit {code}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stronghold2_patcher import Stronghold2Worker
+import standin
+
+def context_switches(thread):
+    with open(f"/proc/self/task/{thread.native_id}/status") as f:
+        fields = dict(line.split(':', 1) for line in f if line.startswith(('voluntary', 'nonvoluntary')))
+    return sum(int(value) for value in fields.values())
+
+def stop_latency(rounds):
+    latencies = []
+    for _ in range(rounds):
+        worker = Stronghold2Worker()
+        worker.start()
+        time.sleep(0.3 + random.random() * 1.5)
+        start = time.perf_counter()
+        worker.stop()
+        worker.wait()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def idle_wakeups(duration):
+    worker = Stronghold2Worker()
+    worker.start()
+    time.sleep(1.0)
+    before = context_switches(worker.thread)
+    time.sleep(duration)
+    wakeups = context_switches(worker.thread) - before
+    worker.stop()
+    worker.wait()
+    return wakeups * 60 / duration
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker stop latency and idle wakeups per minute")
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--duration', type=float, default=30.0)
+    args = parser.parse_args()
+
+    random.seed(1)
+    for label, children in (("no game", []), ("game running", None)):
+        if children is None:
+            children = standin.spawn(1)
+        try:
+            latencies = stop_latency(args.rounds)
+            wakeups = idle_wakeups(args.duration)
+            print(f"{label:13} stop median {statistics.median(latencies):8.2f} ms  max {max(latencies):8.2f} ms  "
+                  f"idle wakeups {wakeups:7.1f}/min")
+        finally:
+            standin.terminate(children)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stronghold2_patcher import Stronghold2Worker
+import standin
+
+class TimedWorker(Stronghold2Worker):
+
+    def __init__(self, use_proc_connector=True):
+        super().__init__(use_proc_connector=use_proc_connector)
+        self.detected = {}
+        self.ticks = 0
+        self.waits = 0
+
+    def add_target(self, pid):
+        self.detected.setdefault(pid, time.monotonic())
+        return super().add_target(pid)
+
+    def service_target(self, target, states=None):
+        self.ticks += 1
+        return super().service_target(target, states)
+
+    async def wait_events(self, timeout):
+        self.waits += 1
+        return await super().wait_events(timeout)
+
+def cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def io_calls(stats):
+    return stats['reads'] + stats['writes'] + stats.get('vm_calls', 0) + stats['opens'] + stats['closes']
+
+def collect(child, info, events):
+    for line in child.stdout:
+        event = json.loads(line)
+        events.append((info['pid'], event['event'], event['time']))
+
+def percentiles(values):
+    if not values:
+        return "      n/a"
+    values = sorted(values)
+    return (f"p50 {values[len(values) // 2] * 1000:8.2f} ms  p95 {values[int(len(values) * 0.95)] * 1000:8.2f} ms  "
+            f"max {values[-1] * 1000:8.2f} ms")
+
+def measure(args):
+    worker = TimedWorker(use_proc_connector=not args.poll)
+    worker.start()
+    time.sleep(args.idle)
+
+    children = standin.spawn(args.instances, args.reset_interval, args.watch)
+    try:
+        events = []
+        readers = [threading.Thread(target=collect, args=(child, info, events), daemon=True) for child, info in children]
+        for reader in readers:
+            reader.start()
+
+        cpu_start = cpu_time()
+        io_start = io_calls(worker.memory.stats())
+        ticks_start = worker.ticks
+        waits_start = worker.waits
+        time.sleep(args.duration)
+        cpu = cpu_time() - cpu_start
+        io = io_calls(worker.memory.stats()) - io_start
+        ticks = worker.ticks - ticks_start
+        waits = worker.waits - waits_start
+    finally:
+        worker.stop()
+        worker.wait()
+        standin.terminate(children)
+
+    ready = {info['pid']: info['time'] for _, info in children}
+    detection = [worker.detected[pid] - ready[pid] for pid in ready if pid in worker.detected]
+    first_patch = {}
+    repatch = []
+    pending = {}
+    for pid, event, when in sorted(events, key=lambda item: item[2]):
+        if event == 'reset':
+            pending[pid] = when
+        elif event == 'patched':
+            first_patch.setdefault(pid, when - ready[pid])
+            if pid in pending:
+                repatch.append(when - pending.pop(pid))
+
+    return {
+        "detection": detection,
+        "first_patch": list(first_patch.values()),
+        "repatch": repatch,
+        "missed": len(ready) - len(detection),
+        "unpatched": len(pending),
+        "cpu_per_tick": cpu / ticks if ticks else 0.0,
+        "io_per_tick": io / ticks if ticks else 0.0,
+        "waits_per_tick": waits / ticks if ticks else 0.0,
+        "cpu_per_second": cpu / args.duration,
+        "ticks": ticks,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Detection and patch path benchmark against Stronghold2.exe stand-ins")
+    parser.add_argument('--instances', type=int, default=1)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds to observe each round")
+    parser.add_argument('--reset-interval', type=float, default=1.7, help="seconds between flag resets in the stand-in")
+    parser.add_argument('--watch', type=float, default=0.001, help="stand-in flag polling interval")
+    parser.add_argument('--idle', type=float, default=1.0, help="seconds the worker waits before the stand-ins start")
+    parser.add_argument('--poll', action='store_true', help="disable the proc connector and use /proc polling")
+    args = parser.parse_args()
+
+    for round_index in range(args.rounds):
+        result = measure(args)
+        print(f"round {round_index + 1}: {result['ticks']} ticks  missed {result['missed']}  "
+              f"resets pending at end {result['unpatched']}")
+        print(f"  detection      {percentiles(result['detection'])}")
+        print(f"  first patch    {percentiles(result['first_patch'])}")
+        print(f"  repatch        {percentiles(result['repatch'])}")
+        print(f"  per tick       cpu {result['cpu_per_tick'] * 1e6:8.1f} us  memory syscalls {result['io_per_tick']:5.2f}  "
+              f"waits {result['waits_per_tick']:5.2f}")
+        print(f"  cpu            {result['cpu_per_second'] * 1000:8.2f} ms/s")
+
+if __name__ == "__main__":
+    main()
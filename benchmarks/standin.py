@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import mmap
+import time
+import ctypes
+import signal
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stronghold2_patcher import MODULE_NAME, POINTER_OFFSET, ADDRESS_OFFSET, A_BYTES
+
+PR_SET_NAME = 15
+MAP_32BIT = 0x40
+STRUCT_SIZE = 0x2000
+LOBBY_OFFSET = 0x100
+
+def allocate_low(size):
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.mmap.restype = ctypes.c_void_p
+    libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_long]
+    address = libc.mmap(None, size, mmap.PROT_READ | mmap.PROT_WRITE,
+                        mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS | MAP_32BIT, -1, 0)
+    if address in (None, ctypes.c_void_p(-1).value):
+        raise OSError(ctypes.get_errno(), "mmap MAP_32BIT failed")
+    return address
+
+def build_module(directory, struct_address):
+    path = os.path.join(directory, MODULE_NAME)
+    with open(path, 'wb') as f:
+        f.truncate(POINTER_OFFSET + mmap.PAGESIZE)
+        f.seek(POINTER_OFFSET)
+        f.write(struct_address.to_bytes(A_BYTES, 'little'))
+    return path
+
+def module_address(path):
+    with open("/proc/self/maps") as f:
+        for line in f:
+            if line.rstrip().endswith(path):
+                return int(line.split('-', 1)[0], 16)
+    raise OSError(f"{path} is not mapped")
+
+def write_pointer(address, value):
+    fd = os.open("/proc/self/mem", os.O_RDWR)
+    try:
+        os.pwrite(fd, value.to_bytes(A_BYTES, 'little'), address)
+    finally:
+        os.close(fd)
+
+def report(event, **fields):
+    print(json.dumps(dict(fields, event=event, time=time.monotonic())), flush=True)
+
+def serve(args):
+    signal.signal(signal.SIGTERM, lambda s, f: sys.exit(0))
+
+    struct_address = allocate_low(STRUCT_SIZE)
+    flag = ctypes.c_uint8.from_address(struct_address + ADDRESS_OFFSET)
+    lobby = ctypes.c_uint8.from_address(struct_address + LOBBY_OFFSET)
+    in_lobby = args.lobby_time > 0
+    lobby.value = in_lobby
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = build_module(directory, struct_address)
+        with open(path, 'rb') as f:
+            image = mmap.mmap(f.fileno(), 0, flags=mmap.MAP_PRIVATE, prot=mmap.PROT_READ | mmap.PROT_EXEC)
+        root = module_address(path) + POINTER_OFFSET
+
+        ctypes.CDLL(None).prctl(PR_SET_NAME, MODULE_NAME.encode(), 0, 0, 0)
+        report("ready", pid=os.getpid(), struct=struct_address, flag=struct_address + ADDRESS_OFFSET)
+
+        def reset_after(now):
+            interval = args.reset_interval if in_lobby or args.lobby_time <= 0 else args.match_reset_interval
+            return now + interval if interval > 0 else None
+
+        next_reset = reset_after(time.monotonic())
+        next_phase = time.monotonic() + args.lobby_time if in_lobby else None
+        next_move = time.monotonic() + args.move_interval if args.move_interval > 0 else None
+        attach_at = None
+        stale = []
+        patched = False
+        while True:
+            now = time.monotonic()
+            if next_reset is not None and now >= next_reset:
+                flag.value = 0
+                patched = False
+                next_reset = reset_after(now)
+                if args.watch:
+                    report("reset")
+            if next_phase is not None and now >= next_phase:
+                in_lobby = not in_lobby
+                lobby.value = in_lobby
+                next_reset = reset_after(now)
+                next_phase = now + (args.lobby_time if in_lobby else args.match_time)
+                report("phase", lobby=in_lobby)
+            if next_move is not None and now >= next_move:
+                stale.append(flag)
+                flag.value = 0
+                struct_address = allocate_low(STRUCT_SIZE)
+                flag = ctypes.c_uint8.from_address(struct_address + ADDRESS_OFFSET)
+                lobby = ctypes.c_uint8.from_address(struct_address + LOBBY_OFFSET)
+                lobby.value = in_lobby
+                write_pointer(root, 0)
+                attach_at = now + args.move_gap
+                patched = False
+                next_move = now + args.move_interval
+                report("moved", struct=struct_address, flag=struct_address + ADDRESS_OFFSET)
+            if attach_at is not None and now >= attach_at:
+                write_pointer(root, struct_address)
+                attach_at = None
+                report("attached")
+            if args.watch and not patched and flag.value:
+                patched = True
+                report("patched")
+            for old in stale:
+                if old.value:
+                    old.value = 0
+                    report("stale")
+
+            timeout = args.watch if args.watch else 3600
+            for deadline in (next_reset, next_phase, next_move, attach_at):
+                if deadline is not None:
+                    timeout = min(timeout, deadline - now)
+            time.sleep(max(timeout, 0))
+
+def spawn(count, reset_interval=0.0, watch=0.0, move_interval=0.0, move_gap=0.0, lobby_time=0.0, match_time=0.0,
+          match_reset_interval=0.0):
+    children = []
+    for _ in range(count):
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--reset-interval', str(reset_interval),
+                                  '--watch', str(watch), '--move-interval', str(move_interval),
+                                  '--move-gap', str(move_gap), '--lobby-time', str(lobby_time),
+                                  '--match-time', str(match_time), '--match-reset-interval', str(match_reset_interval)],
+                                 stdout=subprocess.PIPE, text=True)
+        children.append(child)
+    return [(child, json.loads(child.stdout.readline())) for child in children]
+
+def terminate(children):
+    for child, _ in children:
+        child.terminate()
+    for child, _ in children:
+        child.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in process that mimics the Stronghold2.exe AI flag layout")
+    parser.add_argument('--reset-interval', type=float, default=0.0, help="seconds between flag resets, 0 disables")
+    parser.add_argument('--watch', type=float, default=0.0,
+                        help="poll the flag at this interval and report reset/patched events, 0 disables")
+    parser.add_argument('--move-interval', type=float, default=0.0,
+                        help="seconds between moving the flag struct to a new allocation, 0 disables")
+    parser.add_argument('--move-gap', type=float, default=0.0,
+                        help="seconds the root pointer stays null while the struct moves")
+    parser.add_argument('--lobby-time', type=float, default=0.0,
+                        help="seconds spent in the lobby before each match, 0 disables the lobby/match cycle")
+    parser.add_argument('--match-time', type=float, default=0.0, help="seconds each match lasts")
+    parser.add_argument('--match-reset-interval', type=float, default=0.0,
+                        help="seconds between flag resets during a match, 0 disables")
+    serve(parser.parse_args())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,887 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+import signal
+
+def check_and_install_pyqt5():
+    try:
+        from PyQt5.QtWidgets import QApplication
+        return True
+    except ImportError:
+        print("PyQt5 not found. Attempting to install...")
+
+        try:
+            if os.path.exists('/etc/arch-release'):
+                subprocess.run(['sudo', 'pacman', '-S', '--noconfirm', 'python-pyqt5'], check=True)
+            elif os.path.exists('/etc/debian_version'):
+                subprocess.run(['sudo', 'apt', 'update'], check=True)
+                subprocess.run(['sudo', 'apt', 'install', '-y', 'python3-pyqt5'], check=True)
+            elif os.path.exists('/etc/fedora-release'):
+                subprocess.run(['sudo', 'dnf', 'install', '-y', 'python3-qt5'], check=True)
+            elif os.path.exists('/etc/SuSE-release'):
+                subprocess.run(['sudo', 'zypper', 'install', '-y', 'python3-qt5'], check=True)
+            else:
+                print("Unknown distribution. Please install PyQt5 manually:")
+                print("sudo pip3 install PyQt5")
+                return False
+
+            print("PyQt5 installed successfully!")
+            return True
+
+        except subprocess.CalledProcessError:
+            print("Error installing PyQt5. Try:")
+            print("sudo pip3 install PyQt5")
+            return False
+
+if not check_and_install_pyqt5():
+    sys.exit(1)
+
+try:
+    from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                                QHBoxLayout, QLabel, QPushButton, QListView,
+                                QFrame, QSystemTrayIcon, QMenu, QAction,
+                                QMessageBox, QTabWidget, QComboBox, QTableWidget,
+                                QTableWidgetItem, QHeaderView, QFileDialog)
+    from PyQt5.QtCore import (QTimer, QThread, pyqtSignal, Qt, QSize, QPointF,
+                              QAbstractListModel, QModelIndex)
+    from PyQt5.QtGui import QFont, QIcon, QPixmap, QPainter, QColor, QPalette, QPen, QPolygonF
+except ImportError as e:
+    print(f"PyQt5 import error: {e}")
+    print("Try: sudo pip3 install PyQt5")
+    sys.exit(1)
+
+
+import stronghold2_patcher as core
+from stronghold2_patcher import LANG, Stronghold2Worker
+
+current_language = core.current_language
+
+COUNTER_FLUSH_MS = 500
+SPARKLINE_POINTS = 300
+LOG_REFRESH_MS = 250
+LOG_COLORS = {"info": "#bdc3c7", "warning": "#f39c12", "error": "#e74c3c"}
+LOG_ADDRESS_FIELDS = ("address",)
+
+class Stronghold2Thread(QThread):
+
+    status_changed = pyqtSignal(str, bool)
+    ai_enabled = pyqtSignal()
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, helper_path=None, metrics=None, patch_path=None, recorder=None, log=None):
+        super().__init__()
+        self.worker = Stronghold2Worker(helper_path=helper_path, metrics=metrics, patch_path=patch_path,
+                                        recorder=recorder, log=log)
+        self.worker.status_changed.connect(self.status_changed.emit)
+        self.worker.ai_enabled.connect(self.ai_enabled.emit)
+        self.worker.error_occurred.connect(self.error_occurred.emit)
+
+    def run(self):
+        self.worker.run()
+
+    def stop(self):
+        self.worker.stop()
+
+class Sparkline(QWidget):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = []
+        self.setMinimumHeight(60)
+
+    def set_values(self, values):
+        if values != self.values:
+            self.values = values
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = self.rect().adjusted(4, 4, -4, -4)
+        painter.setPen(QPen(QColor(93, 109, 126), 1))
+        painter.drawRoundedRect(rect, 8, 8)
+        if len(self.values) < 2:
+            return
+
+        rect = rect.adjusted(6, 6, -6, -6)
+        low = min(self.values)
+        span = (max(self.values) - low) or 1
+        step = rect.width() / (len(self.values) - 1)
+        points = [QPointF(rect.left() + index * step, rect.bottom() - (value - low) / span * rect.height())
+                  for index, value in enumerate(self.values)]
+        painter.setPen(QPen(QColor(46, 204, 113), 2))
+        painter.drawPolyline(QPolygonF(points))
+
+class EventLogModel(QAbstractListModel):
+
+    def __init__(self, log, parent=None):
+        super().__init__(parent)
+        self.log = log
+        self.rows = []
+        self.sequence = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, when, level, event, fields = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            stamp = time.strftime('%H:%M:%S', time.localtime(when))
+            details = ' '.join(f"{key}=0x{value:x}" if key in LOG_ADDRESS_FIELDS and isinstance(value, int)
+                               else f"{key}={value}" for key, value in fields.items())
+            return f"{stamp}.{int(when * 1000) % 1000:03d}  {level.upper():7}  {event}  {details}"
+        if role == Qt.ForegroundRole:
+            return QColor(LOG_COLORS.get(level, LOG_COLORS["info"]))
+        return None
+
+    def refresh(self):
+        entries = self.log.since(self.sequence)
+        if not entries:
+            return False
+        self.sequence = entries[-1][0]
+
+        overflow = min(len(self.rows) + len(entries) - self.log.capacity, len(self.rows))
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self.rows[:overflow]
+            self.endRemoveRows()
+
+        start = len(self.rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        self.rows.extend(entries)
+        self.endInsertRows()
+        return True
+
+class Stronghold2GUI(QMainWindow):
+
+    def __init__(self, metrics_port=None, patch_path=None, record_rate=core.RECORDER_RATE, log_path=None):
+        super().__init__()
+        self.worker = None
+        self.patch_path = patch_path
+        self.recorder = core.ValueRecorder(record_rate)
+        self.log = core.EventLog(log_path)
+        self.ai_count = 0
+        self.helper_dir = None
+        self.helper_path = None
+        self.helper_process = None
+        self.tray_message = None
+        self.counter_pending = False
+        self.metrics = core.Metrics()
+        self.init_ui()
+        self.setup_tray()
+        self.check_root_privileges()
+        self.update_ui_language()
+        if metrics_port:
+            try:
+                core.serve_metrics(self.metrics, metrics_port)
+            except OSError as e:
+                self.set_status(LANG["status_error"][current_language].format(e), False)
+
+    def init_ui(self):
+        self.setWindowTitle(LANG["app_title"][current_language])
+        self.setMinimumSize(600, 500)
+
+        self.setStyleSheet("""
+            QMainWindow {
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #2c3e50, stop: 1 #34495e);
+            }
+            QWidget {
+                background: transparent;
+                color: #ecf0f1;
+                font-family: 'Segoe UI', 'Ubuntu', sans-serif;
+            }
+            QTabWidget::pane {
+                border-top: 2px solid #3498db;
+                border-radius: 10px;
+                background: rgba(44, 62, 80, 0.7);
+            }
+            QTabBar::tab {
+                background: #34495e;
+                border: 2px solid #2c3e50;
+                border-bottom-color: #3498db;
+                border-top-left-radius: 8px;
+                border-top-right-radius: 8px;
+                padding: 10px 15px;
+                color: #ecf0f1;
+                font-weight: bold;
+            }
+            QTabBar::tab:selected {
+                background: #3498db;
+                border-color: #3498db;
+                border-bottom-color: #3498db;
+                margin-bottom: -2px;
+            }
+            QTabBar::tab:hover {
+                background: #3fb4f3;
+            }
+        """)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        language_layout = QHBoxLayout()
+        self.language_label = QLabel(LANG["language_label"][current_language])
+        self.language_label.setStyleSheet("color: #ecf0f1; font-size: 14px;")
+        language_layout.addWidget(self.language_label)
+
+        self.language_combo = QComboBox()
+        self.language_combo.addItem("English", "en")
+        self.language_combo.addItem("Українська", "uk")
+        self.language_combo.addItem("Русский", "ru")
+        self.language_combo.currentIndexChanged.connect(self.change_language)
+        self.language_combo.setCurrentIndex(self.language_combo.findData(current_language))
+
+        self.language_combo.setStyleSheet("""
+            QComboBox {
+                background: #34495e;
+                border: 1px solid #2c3e50;
+                border-radius: 5px;
+                padding: 5px;
+                color: #ecf0f1;
+                min-width: 100px;
+            }
+            QComboBox::drop-down {
+                border: none;
+            }
+            QComboBox::down-arrow {
+                image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAcAAAAECAYAAADtTWMxAAAAAXNSR0IArs4c6QAAADFJREFUCJljYGBgeP///38gWzABoGNgYGAg2RkYQPiFgX0Ggg+FGBgQCJtBwAgAUv8F/R0s/WwAAAAASUVORK5CYII=);
+                width: 10px;
+                height: 10px;
+            }
+            QComboBox QAbstractItemView {
+                background: #34495e;
+                border: 1px solid #2c3e50;
+                selection-background-color: #3498db;
+                color: #ecf0f1;
+            }
+        """)
+        language_layout.addWidget(self.language_combo)
+        language_layout.addStretch()
+        main_layout.addLayout(language_layout)
+
+        self.tabs = QTabWidget()
+        self.tabs.tabBar().setExpanding(True)
+        self.tabs.setStyleSheet("""
+            QTabWidget {
+                border-radius: 10px;
+            }
+        """)
+        main_layout.addWidget(self.tabs)
+
+        self.create_status_tab()
+        self.create_metrics_tab()
+        self.create_log_tab()
+        self.create_about_tab()
+
+        main_layout.addStretch()
+
+    def create_status_tab(self):
+        status_tab = QWidget()
+        status_layout = QVBoxLayout(status_tab)
+        status_layout.setSpacing(25)
+        status_layout.setContentsMargins(30, 20, 30, 20)
+
+        self.title_label = QLabel(LANG["title_main"][current_language])
+        self.title_label.setAlignment(Qt.AlignCenter)
+        self.title_label.setStyleSheet("""
+            QLabel {
+                font-size: 28px;
+                font-weight: bold;
+                color: #3498db;
+                padding: 25px;
+                border-bottom: 3px solid #3498db;
+                margin-bottom: 15px;
+                background: rgba(52, 152, 219, 0.1);
+                border-radius: 10px;
+            }
+        """)
+        status_layout.addWidget(self.title_label)
+
+        self.status_label = QLabel(LANG["status_initial"][current_language])
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setProperty("state", "neutral")
+        self.status_label.setStyleSheet("""
+            QLabel {
+                background: rgba(149, 165, 166, 0.2);
+                border: 2px solid #95a5a6;
+                border-radius: 12px;
+                padding: 20px;
+                font-size: 18px;
+                font-weight: bold;
+                color: #ecf0f1;
+                min-height: 40px;
+            }
+            QLabel[state="success"] {
+                background: rgba(39, 174, 96, 0.3);
+                border: 2px solid #27ae60;
+                color: #2ecc71;
+            }
+            QLabel[state="error"] {
+                background: rgba(231, 76, 60, 0.3);
+                border: 2px solid #e74c3c;
+                color: #e74c3c;
+            }
+        """)
+        status_layout.addWidget(self.status_label)
+
+        self.counter_label = QLabel(LANG["ai_counter"][current_language].format(self.ai_count))
+        self.counter_label.setAlignment(Qt.AlignCenter)
+        self.counter_label.setStyleSheet("""
+            QLabel {
+                font-size: 16px;
+                color: #bdc3c7;
+                padding: 15px;
+                background: rgba(127, 140, 141, 0.1);
+                border-radius: 8px;
+                margin: 10px 0;
+            }
+        """)
+        status_layout.addWidget(self.counter_label)
+
+        history_layout = QHBoxLayout()
+        self.history_label = QLabel(LANG["history_label"][current_language])
+        self.history_label.setStyleSheet("""
+            QLabel {
+                font-size: 14px;
+                color: #bdc3c7;
+            }
+        """)
+        history_layout.addWidget(self.history_label)
+        history_layout.addStretch()
+
+        self.export_button = QPushButton(LANG["button_export_history"][current_language])
+        self.export_button.clicked.connect(self.export_history)
+        self.export_button.setStyleSheet("""
+            QPushButton {
+                background: rgba(52, 152, 219, 0.3);
+                border: 1px solid #3498db;
+                color: #ecf0f1;
+                padding: 6px 12px;
+                border-radius: 8px;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background: rgba(52, 152, 219, 0.5);
+            }
+        """)
+        history_layout.addWidget(self.export_button)
+        status_layout.addLayout(history_layout)
+
+        self.sparkline = Sparkline()
+        status_layout.addWidget(self.sparkline)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(20)
+
+        self.start_button = QPushButton(LANG["button_start"][current_language])
+        self.start_button.clicked.connect(self.start_monitoring)
+        self.start_button.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #27ae60, stop: 1 #2ecc71);
+                border: none;
+                color: white;
+                padding: 15px 25px;
+                border-radius: 10px;
+                font-size: 16px;
+                font-weight: bold;
+                min-width: 180px;
+                min-height: 50px;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #2ecc71, stop: 1 #27ae60);
+                transform: translateY(-2px);
+            }
+            QPushButton:pressed {
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #229954, stop: 1 #27ae60);
+            }
+            QPushButton:disabled {
+                background: #7f8c8d;
+                color: #bdc3c7;
+            }
+        """)
+        buttons_layout.addWidget(self.start_button)
+
+        self.stop_button = QPushButton(LANG["button_stop"][current_language])
+        self.stop_button.clicked.connect(self.stop_monitoring)
+        self.stop_button.setEnabled(False)
+        self.stop_button.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #e74c3c, stop: 1 #c0392b);
+                border: none;
+                color: white;
+                padding: 15px 25px;
+                border-radius: 10px;
+                font-size: 16px;
+                font-weight: bold;
+                min-width: 180px;
+                min-height: 50px;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #ec7063, stop: 1 #e74c3c);
+            }
+            QPushButton:pressed {
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #c0392b, stop: 1 #a93226);
+            }
+            QPushButton:disabled {
+                background: #7f8c8d;
+                color: #bdc3c7;
+            }
+        """)
+        buttons_layout.addWidget(self.stop_button)
+
+        status_layout.addLayout(buttons_layout)
+        status_layout.addStretch()
+
+        self.tabs.addTab(status_tab, LANG["tab_status"][current_language])
+        self.status_tab = status_tab
+
+        self.history_timer = QTimer(self)
+        self.history_timer.setInterval(1000)
+        self.history_timer.timeout.connect(self.update_history)
+
+    def create_metrics_tab(self):
+        metrics_tab = QWidget()
+        metrics_layout = QVBoxLayout(metrics_tab)
+        metrics_layout.setSpacing(15)
+        metrics_layout.setContentsMargins(30, 20, 30, 20)
+
+        self.metrics_summary = QLabel()
+        self.metrics_summary.setAlignment(Qt.AlignCenter)
+        self.metrics_summary.setStyleSheet("""
+            QLabel {
+                font-size: 14px;
+                color: #bdc3c7;
+                padding: 10px;
+                background: rgba(127, 140, 141, 0.1);
+                border-radius: 8px;
+            }
+        """)
+        metrics_layout.addWidget(self.metrics_summary)
+
+        headers = LANG["metrics_headers"][current_language]
+        self.metrics_table = QTableWidget(len(core.METRICS_STAGES), len(headers))
+        self.metrics_table.verticalHeader().setVisible(False)
+        self.metrics_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.metrics_table.setSelectionMode(QTableWidget.NoSelection)
+        self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        for row, stage in enumerate(core.METRICS_STAGES):
+            for column in range(len(headers)):
+                self.metrics_table.setItem(row, column, QTableWidgetItem(stage if column == 0 else ''))
+
+        patch_headers = LANG["metrics_patch_headers"][current_language]
+        self.patch_table = QTableWidget(0, len(patch_headers))
+        self.patch_table.verticalHeader().setVisible(False)
+        self.patch_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.patch_table.setSelectionMode(QTableWidget.NoSelection)
+        self.patch_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        for table in (self.metrics_table, self.patch_table):
+            table.setStyleSheet("""
+                QTableWidget {
+                    background: rgba(52, 73, 94, 0.4);
+                    border: 2px solid #5d6d7e;
+                    border-radius: 12px;
+                    gridline-color: #5d6d7e;
+                    font-size: 13px;
+                }
+                QHeaderView::section {
+                    background: rgba(52, 152, 219, 0.3);
+                    color: #ecf0f1;
+                    border: none;
+                    padding: 6px;
+                    font-weight: bold;
+                }
+            """)
+            metrics_layout.addWidget(table)
+
+        self.tabs.addTab(metrics_tab, LANG["tab_metrics"][current_language])
+        self.metrics_tab = metrics_tab
+
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.setInterval(1000)
+        self.metrics_timer.timeout.connect(self.update_metrics)
+        self.tabs.currentChanged.connect(self.sync_timers)
+
+    def create_log_tab(self):
+        log_tab = QWidget()
+        log_layout = QVBoxLayout(log_tab)
+        log_layout.setContentsMargins(30, 20, 30, 20)
+
+        self.log_model = EventLogModel(self.log, self)
+        self.log_view = QListView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setEditTriggers(QListView.NoEditTriggers)
+        self.log_view.setSelectionMode(QListView.ExtendedSelection)
+        self.log_view.setStyleSheet("""
+            QListView {
+                background: rgba(52, 73, 94, 0.4);
+                border: 2px solid #5d6d7e;
+                border-radius: 12px;
+                font-family: monospace;
+                font-size: 12px;
+                padding: 6px;
+            }
+        """)
+        log_layout.addWidget(self.log_view)
+
+        self.tabs.addTab(log_tab, LANG["tab_log"][current_language])
+        self.log_tab = log_tab
+
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(LOG_REFRESH_MS)
+        self.log_timer.timeout.connect(self.update_log)
+
+    def log_visible(self):
+        return self.isVisible() and self.tabs.currentWidget() is self.log_tab
+
+    def update_log(self):
+        if not self.log_visible():
+            return
+        scrollbar = self.log_view.verticalScrollBar()
+        follow = scrollbar.value() == scrollbar.maximum()
+        self.log.drain()
+        if self.log_model.refresh() and follow:
+            self.log_view.scrollToBottom()
+
+    def metrics_visible(self):
+        return self.isVisible() and self.tabs.currentWidget() is self.metrics_tab
+
+    def history_visible(self):
+        return self.isVisible() and self.tabs.currentWidget() is self.status_tab
+
+    def sync_timers(self):
+        self.recorder.active = self.history_visible()
+        if self.worker:
+            self.worker.worker.wake_threadsafe()
+        for visible, timer, update in ((self.metrics_visible(), self.metrics_timer, self.update_metrics),
+                                       (self.history_visible(), self.history_timer, self.update_history),
+                                       (self.log_visible(), self.log_timer, self.update_log)):
+            if visible:
+                update()
+                timer.start()
+            else:
+                timer.stop()
+
+    def update_history(self):
+        if self.history_visible():
+            self.sparkline.set_values(self.recorder.latest(SPARKLINE_POINTS)[1])
+
+    def export_history(self):
+        path, _ = QFileDialog.getSaveFileName(self, LANG["button_export_history"][current_language],
+                                              "stronghold2-history.csv",
+                                              LANG["export_history_filter"][current_language])
+        if not path:
+            return
+        try:
+            self.recorder.export(path)
+            self.set_status(LANG["status_history_exported"][current_language].format(path=path), True)
+        except OSError as e:
+            self.set_status(LANG["status_error"][current_language].format(e), False)
+
+    def update_metrics(self):
+        if not self.metrics_visible():
+            return
+
+        self.metrics_summary.setText(LANG["metrics_summary"][current_language].format(
+            targets=self.metrics.targets, **self.metrics.counters))
+        for row, stage in enumerate(core.METRICS_STAGES):
+            histogram = self.metrics.stages[stage]
+            average = histogram.total / histogram.count if histogram.count else 0.0
+            values = [histogram.count, average, histogram.quantile(0.5), histogram.quantile(0.95),
+                      histogram.maximum, histogram.errors]
+            for column, value in enumerate(values, 1):
+                text = f"{value * 1000:.3f} ms" if isinstance(value, float) else str(value)
+                self.metrics_table.item(row, column).setText(text)
+
+        patches = sorted(self.metrics.patches.items())
+        self.patch_table.setRowCount(len(patches))
+        for row, ((pid, name), stats) in enumerate(patches):
+            stats = stats.stats()
+            values = [name, str(pid), str(stats["checks"]), str(stats["writes"]), str(stats["resets"]),
+                      str(stats["failures"]), f"{stats['uncorrected_avg'] * 1000:.1f} ms",
+                      f"{stats['uncorrected_max'] * 1000:.1f} ms"]
+            for column, text in enumerate(values):
+                item = self.patch_table.item(row, column)
+                if item is None:
+                    self.patch_table.setItem(row, column, QTableWidgetItem(text))
+                else:
+                    item.setText(text)
+
+    def create_about_tab(self):
+        about_tab = QWidget()
+        about_layout = QVBoxLayout(about_tab)
+        about_layout.setSpacing(20)
+        about_layout.setContentsMargins(30, 20, 30, 20)
+
+        about_label = QLabel(LANG["about_text"][current_language])
+        about_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        about_label.setWordWrap(True)
+        about_label.setStyleSheet("""
+            QLabel {
+                background: rgba(52, 73, 94, 0.4);
+                border: 2px solid #5d6d7e;
+                border-radius: 12px;
+                padding: 20px;
+                font-size: 14px;
+                color: #bdc3c7;
+                line-height: 1.4;
+            }
+        """)
+        about_layout.addWidget(about_label)
+        about_layout.addStretch()
+
+        self.tabs.addTab(about_tab, LANG["tab_about"][current_language])
+        self.about_label = about_label
+
+    def change_language(self, index):
+        global current_language
+        current_language = self.language_combo.itemData(index)
+        core.current_language = current_language
+        self.update_ui_language()
+
+    def update_ui_language(self):
+        self.setWindowTitle(LANG["app_title"][current_language])
+        self.language_label.setText(LANG["language_label"][current_language])
+        self.title_label.setText(LANG["title_main"][current_language])
+        self.status_label.setText(LANG["status_initial"][current_language])
+        self.counter_label.setText(LANG["ai_counter"][current_language].format(self.ai_count))
+        self.history_label.setText(LANG["history_label"][current_language])
+        self.export_button.setText(LANG["button_export_history"][current_language])
+        self.start_button.setText(LANG["button_start"][current_language])
+        self.stop_button.setText(LANG["button_stop"][current_language])
+        self.about_label.setText(LANG["about_text"][current_language])
+
+        self.tabs.setTabText(0, LANG["tab_status"][current_language])
+        self.tabs.setTabText(1, LANG["tab_metrics"][current_language])
+        self.tabs.setTabText(2, LANG["tab_log"][current_language])
+        self.tabs.setTabText(3, LANG["tab_about"][current_language])
+        self.metrics_table.setHorizontalHeaderLabels(LANG["metrics_headers"][current_language])
+        self.patch_table.setHorizontalHeaderLabels(LANG["metrics_patch_headers"][current_language])
+        self.update_metrics()
+
+        if hasattr(self, 'tray_icon'):
+            self.tray_icon.setToolTip(LANG["tray_icon_tooltip"][current_language])
+            self.tray_message = None
+            tray_menu = self.tray_icon.contextMenu()
+            if tray_menu:
+                show_action = tray_menu.actions()[0]
+                quit_action = tray_menu.actions()[1]
+                show_action.setText(LANG["tray_show_window"][current_language])
+                quit_action.setText(LANG["tray_quit_app"][current_language])
+
+
+    def setup_tray(self):
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_icon = QSystemTrayIcon(self)
+
+            pixmap = QPixmap(32, 32)
+            pixmap.fill(QColor(52, 152, 219))
+            painter = QPainter(pixmap)
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, "SH2")
+            painter.end()
+
+            self.tray_icon.setIcon(QIcon(pixmap))
+            self.tray_icon.setToolTip(LANG["tray_icon_tooltip"][current_language])
+
+            tray_menu = QMenu()
+
+            show_action = QAction(LANG["tray_show_window"][current_language], self)
+            show_action.triggered.connect(self.show_window)
+            tray_menu.addAction(show_action)
+
+            quit_action = QAction(LANG["tray_quit_app"][current_language], self)
+            quit_action.triggered.connect(self.quit_app)
+            tray_menu.addAction(quit_action)
+
+            self.tray_icon.setContextMenu(tray_menu)
+            self.tray_icon.activated.connect(self.tray_activated)
+            self.tray_icon.show()
+
+    def show_window(self):
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def quit_app(self):
+        if self.worker:
+            self.worker.stop()
+            self.worker.wait()
+        self.cleanup_helper()
+        QApplication.quit()
+
+    def tray_activated(self, reason):
+        if reason == QSystemTrayIcon.DoubleClick:
+            self.show_window()
+
+    def check_root_privileges(self):
+        if os.geteuid() != 0:
+            self.set_status(LANG["status_acquiring_root"][current_language], False)
+            QApplication.processEvents()
+
+            try:
+                current_script = os.path.abspath(core.__file__)
+                self.helper_dir = tempfile.mkdtemp(prefix="sh2-helper-")
+                self.helper_path = os.path.join(self.helper_dir, "helper.sock")
+                self.helper_process = subprocess.Popen([
+                    'pkexec', 'python3', current_script,
+                    '--helper', self.helper_path, '--helper-parent', str(os.getpid())
+                ])
+                QTimer.singleShot(500, self.check_helper)
+            except (OSError, ValueError) as e:
+                self.log.emit("error", "helper_launch_failed", error=str(e))
+                self.set_status(LANG["status_root_error"][current_language].format(e), False)
+        else:
+            self.set_status(LANG["status_root_acquired"][current_language], True)
+
+    def check_helper(self):
+        if self.helper_process is None:
+            return
+        if os.path.exists(self.helper_path):
+            self.set_status(LANG["status_root_acquired"][current_language], True)
+            return
+        code = self.helper_process.poll()
+        if code is None:
+            QTimer.singleShot(500, self.check_helper)
+        else:
+            self.helper_process = None
+            self.helper_path = None
+            self.set_status(LANG["status_root_error"][current_language].format(code), False)
+
+    def cleanup_helper(self):
+        if self.helper_dir:
+            shutil.rmtree(self.helper_dir, ignore_errors=True)
+            self.helper_dir = None
+
+    def set_status(self, message, is_success=None):
+        if self.status_label.text() != message:
+            self.status_label.setText(message)
+
+        state = "success" if is_success is True else "error" if is_success is False else "neutral"
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            self.status_label.style().unpolish(self.status_label)
+            self.status_label.style().polish(self.status_label)
+
+    def start_monitoring(self):
+        self.worker = Stronghold2Thread(self.helper_path, self.metrics, self.patch_path, self.recorder, self.log)
+        self.worker.status_changed.connect(self.update_status)
+        self.worker.ai_enabled.connect(self.ai_activated)
+        self.worker.error_occurred.connect(self.handle_error)
+
+        self.worker.start()
+
+        self.start_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
+        self.ai_count = 0
+        self.update_counter()
+
+    def stop_monitoring(self):
+        if self.worker:
+            self.worker.stop()
+            self.worker.wait()
+            self.worker = None
+
+        self.start_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
+        self.set_status(LANG["status_monitoring_stopped"][current_language])
+
+    def update_status(self, message, is_success):
+        self.set_status(message, is_success)
+        self.update_tray_message(message)
+
+    def update_tray_message(self, message):
+        if hasattr(self, 'tray_icon') and message != self.tray_message:
+            self.tray_message = message
+            self.tray_icon.setToolTip(f"{LANG['tray_icon_tooltip'][current_language]} - {message}")
+
+    def ai_activated(self):
+        self.ai_count += 1
+        message = LANG["status_ai_active"][current_language]
+        self.set_status(message, True)
+        self.update_tray_message(message)
+        if not self.counter_pending:
+            self.counter_pending = True
+            QTimer.singleShot(COUNTER_FLUSH_MS, self.flush_counter)
+
+    def flush_counter(self):
+        self.counter_pending = False
+        self.update_counter()
+
+    def update_counter(self):
+        self.counter_label.setText(LANG["ai_counter"][current_language].format(self.ai_count))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sync_timers()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.sync_timers()
+
+    def handle_error(self, error):
+        self.set_status(LANG["status_error"][current_language].format(error), False)
+
+    def closeEvent(self, event):
+        if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
+            self.hide()
+            if hasattr(self, 'tray_icon'):
+                self.tray_icon.showMessage(
+                    LANG["tray_minimize_message_title"][current_language],
+                    LANG["tray_minimize_message_text"][current_language],
+                    QSystemTrayIcon.Information,
+                    3000
+                )
+            event.ignore()
+        else:
+            if self.worker:
+                self.worker.stop()
+                self.worker.wait()
+            self.cleanup_helper()
+            event.accept()
+
+def main(metrics_port=None, patch_path=None, record_rate=core.RECORDER_RATE, log_path=None):
+    app = QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+
+    app.setApplicationName("Stronghold 2 AI Enabler")
+    app.setApplicationVersion("2.0")
+    app.setOrganizationName("GameModders")
+
+    window = Stronghold2GUI(metrics_port, patch_path, record_rate, log_path)
+    window.show()
+
+    signal.signal(signal.SIGINT, lambda s, f: app.quit())
+    signal.signal(signal.SIGTERM, lambda s, f: app.quit())
+
+    print("🏰 Stronghold 2 AI Enabler v2.0 launched!")
+    print("   Use GUI to control or Ctrl+C to exit")
+
+    try:
+        sys.exit(app.exec_())
+    except KeyboardInterrupt:
+        print("\n⏹️ Program stopped by user")
+        if window.worker:
+            window.worker.stop()
+            window.worker.wait()
+        window.cleanup_helper()
+        sys.exit(0)
@@ -5,179 +5,2542 @@ import os
 import sys
 import time
 import struct
-import subprocess
 import signal
 import threading
+import ctypes
+import errno
+import mmap
+import itertools
+import functools
+import re
+import socket
+import select
+import heapq
+import bisect
+import collections
+import array
+import copy
+import json
+import argparse
+import asyncio
 
-def check_and_install_pyqt5():
-    try:
-        from PyQt5.QtWidgets import QApplication
-        return True
-    except ImportError:
-        print("PyQt5 not found. Attempting to install...")
+MODULE_NAME = "Stronghold2.exe"
+POINTER_OFFSET = 0x00ec5f28
+ADDRESS_OFFSET = 0xd28
+A_BYTES = 4
+V_BYTES = 1
+PROC_SETTLE_TIME = 5.0
+PATCH_INTERVAL = 1.0
+RETRY_INTERVAL = 2.0
+RETRY_MIN_INTERVAL = 0.05
+DETECT_INTERVAL = 2.0
+HELPER_OP_SCAN = 0
+HELPER_OP_READ = 1
+HELPER_OP_WRITE = 2
+HELPER_OP_MAPS = 3
+HELPER_MAX_MESSAGE = 64 << 10
+HELPER_MAX_REPLY = 16 << 20
+HELPER_CONNECT_TIMEOUT = 120.0
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+PROC_EVENT_NONE = 0x00000000
+PROC_EVENT_EXEC = 0x00000002
+PROC_CN_ACK_TIMEOUT = 1.0
+PROC_EVENT_COMM = 0x00000200
+IOV_MAX = 1024
+VM_BATCH_MIN = 8
+AI_POINTER_CHAIN = f"[{MODULE_NAME}+0x{POINTER_OFFSET:x}]+0x{ADDRESS_OFFSET:x}"
+AI_POINTER_SIGNATURE = None
+PATCH_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patches.json")
+PATCH_TYPES = {
+    "u8": 'B', "i8": 'b', "u16": '<H', "i16": '<h', "u32": '<I', "i32": '<i',
+    "u64": '<Q', "i64": '<q', "f32": '<f', "f64": '<d',
+}
+PATCH_MODES = ("enforce", "once", "lobby")
+FREEZE_MAX_RATE = 1000.0
+FREEZE_SLACK = 0.002
+ADAPT_TIGHTEN = 4.0
+ADAPT_GROWTH = 1.25
+ADAPT_MATCH_GROWTH = 2.0
+RECORDER_RATE = 10.0
+RECORDER_CAPACITY = 36000
+RECORDER_MAX_SERIES = 64
+RECORDER_MAGIC = b'SH2R'
+DEFAULT_PATCHES = [
+    {"name": "ai_enabled", "chain": AI_POINTER_CHAIN, "signature": AI_POINTER_SIGNATURE,
+     "type": "u8", "value": 1, "mode": "enforce", "min_rate": 1, "max_rate": 10},
+]
+SCAN_CHUNK = 4 << 20
+SCAN_PARALLEL_MIN = 64 << 20
+SCAN_PARALLEL_SLICE = 16 << 20
+METRICS_STAGES = ("discovery", "maps", "resolve", "read", "write")
+METRICS_COUNTERS = ("ticks", "patch_writes", "patch_failures", "pointer_moves")
+METRICS_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1)
+EVENT_LOG_CAPACITY = 10000
+EVENT_LOG_MAX_BYTES = 1 << 20
+EVENT_LOG_BACKUPS = 3
+SNAPSHOT_BLOCK = 256 << 10
+SNAPSHOT_MAGIC = b'SH2S'
+SNAPSHOT_HEADER = struct.Struct('<4sHIQIQI')
+SNAPSHOT_ENTRY = struct.Struct('<QQQ')
+SCAN_VALUE_SIZES = (1, 2, 4, 8)
+SCAN_LIST_LIMIT = 20
+POINTER_SCAN_DEPTH = 3
+POINTER_SCAN_OFFSET = 0x1000
+POINTER_SCAN_LIMIT = 10000
+POINTER_SCAN_VERIFY_DELAY = 5.0
+CHAIN_TOKEN = re.compile(r"\s*(\[|\]|[+-]|[^\[\]+\-\s]+)")
+
+class ProcessScanner:
+
+    def __init__(self, name=MODULE_NAME):
+        self.name = name.lower()
+        self.comm = name[:15].lower()
+        self.known = {}
+        self.inspections = 0
+
+    def inspect(self, pid):
+        self.inspections += 1
+        try:
+            with open(f"/proc/{pid}/stat", 'rb') as f:
+                stat = f.read()
+            head, _, tail = stat.rpartition(b')')
+            start_time = int(tail.split()[19])
+            comm = head.partition(b'(')[2].decode('utf-8', 'replace')
+        except (OSError, ValueError, IndexError):
+            return None
+
+        if comm.lower() == self.comm:
+            return start_time, True
 
         try:
-            if os.path.exists('/etc/arch-release'):
-                subprocess.run(['sudo', 'pacman', '-S', '--noconfirm', 'python-pyqt5'], check=True)
-            elif os.path.exists('/etc/debian_version'):
-                subprocess.run(['sudo', 'apt', 'update'], check=True)
-                subprocess.run(['sudo', 'apt', 'install', '-y', 'python3-pyqt5'], check=True)
-            elif os.path.exists('/etc/fedora-release'):
-                subprocess.run(['sudo', 'dnf', 'install', '-y', 'python3-qt5'], check=True)
-            elif os.path.exists('/etc/SuSE-release'):
-                subprocess.run(['sudo', 'zypper', 'install', '-y', 'python3-qt5'], check=True)
-            else:
-                print("Unknown distribution. Please install PyQt5 manually:")
-                print("sudo pip3 install PyQt5")
-                return False
+            with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                argv0 = f.read().split(b'\0', 1)[0].decode('utf-8', 'replace')
+        except OSError:
+            return start_time, False
 
-            print("PyQt5 installed successfully!")
-            return True
+        exe = argv0.replace('\\', '/').rsplit('/', 1)[-1]
+        return start_time, exe.lower() == self.name
 
-        except subprocess.CalledProcessError:
-            print("Error installing PyQt5. Try:")
-            print("sudo pip3 install PyQt5")
-            return False
+    def read_start_time(self, pid):
+        try:
+            with open(f"/proc/{pid}/stat", 'rb') as f:
+                return int(f.read().rpartition(b')')[2].split()[19])
+        except (OSError, ValueError, IndexError):
+            return None
 
-if not check_and_install_pyqt5():
-    sys.exit(1)
-
-try:
-    from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                                QHBoxLayout, QLabel, QPushButton, QTextEdit,
-                                QFrame, QSystemTrayIcon, QMenu, QAction,
-                                QMessageBox, QTabWidget, QComboBox)
-    from PyQt5.QtCore import QTimer, QThread, pyqtSignal, Qt, QSize
-    from PyQt5.QtGui import QFont, QIcon, QPixmap, QPainter, QColor, QPalette
-except ImportError as e:
-    print(f"PyQt5 import error: {e}")
-    print("Try: sudo pip3 install PyQt5")
-    sys.exit(1)
+    def start_time(self, pid):
+        info = self.known.get(pid)
+        return info[0] if info else None
 
-MODULE_NAME = "Stronghold2.exe"
-POINTER_OFFSET = 0x00ec5f28
-ADDRESS_OFFSET = 0xd28
-A_BYTES = 4
-V_BYTES = 1
+    def forget(self, pid):
+        self.known.pop(pid, None)
+
+    def scan(self):
+        try:
+            entries = os.listdir('/proc')
+        except OSError:
+            return []
+
+        now = time.monotonic()
+        known = self.known
+        current = {}
+        matches = []
+
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            pid = int(entry)
+            info = known.get(pid)
+
+            if info is not None:
+                start_time, matched, first_seen = info
+                if matched:
+                    if self.read_start_time(pid) != start_time:
+                        info = None
+                elif now - first_seen < PROC_SETTLE_TIME:
+                    result = self.inspect(pid)
+                    if result is None:
+                        continue
+                    if result[0] != start_time:
+                        first_seen = now
+                    info = (result[0], result[1], first_seen)
+
+            if info is None:
+                result = self.inspect(pid)
+                if result is None:
+                    continue
+                info = (result[0], result[1], now)
+
+            current[pid] = info
+            if info[1]:
+                matches.append(pid)
 
-class Stronghold2Worker(QThread):
+        self.known = current
+        matches.sort()
+        return matches
 
-    status_changed = pyqtSignal(str, bool)
-    ai_enabled = pyqtSignal()
-    error_occurred = pyqtSignal(str)
+class ProcConnector:
 
     def __init__(self):
-        super().__init__()
-        self.running = False
-        self.shpid = 0
-        self.ai_address = 0
+        self.sock = None
+        self.events = 0
+        self.overflowed = False
 
-    def find_stronghold_pid(self):
+    def control(self, op):
+        payload = struct.pack('=IIIIHHI', CN_IDX_PROC, CN_VAL_PROC, 0, 0, 4, 0, op)
+        header = struct.pack('=IHHII', 16 + len(payload), 3, 0, 0, os.getpid())
+        self.sock.send(header + payload)
+
+    def open(self):
         try:
-            result = subprocess.run(['pgrep', '-f', 'Stronghold2.exe'],
-                                  capture_output=True, text=True)
-
-            if result.returncode == 0:
-                pids = result.stdout.strip().split('\n')
-                for pid in pids:
-                    if pid.strip().isdigit():
-                        pid_int = int(pid.strip())
-                        if os.path.exists(f"/proc/{pid_int}"):
-                            return pid_int
-            return 0
-        except Exception:
-            return 0
+            self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+            self.sock.bind((0, CN_IDX_PROC))
+            self.control(PROC_CN_MCAST_LISTEN)
+            if self.acknowledged():
+                return True
+        except (OSError, AttributeError):
+            pass
+        self.close()
+        return False
+
+    def acknowledged(self, timeout=PROC_CN_ACK_TIMEOUT):
+        deadline = time.monotonic() + timeout
+        while True:
+            ready, _, _ = select.select([self.sock], [], [], max(deadline - time.monotonic(), 0))
+            if not ready:
+                return False
+            data = self.sock.recv(4096)
+            if len(data) >= 56 and struct.unpack_from('=I', data, 36)[0] == PROC_EVENT_NONE:
+                return struct.unpack_from('=I', data, 52)[0] == 0
 
-    def get_base_address(self, pid):
+    def wait(self, timeout):
+        if self.sock is None:
+            return None
+        pids = []
         try:
-            maps_path = f"/proc/{pid}/maps"
-            if not os.path.exists(maps_path):
-                return 0
-
-            with open(maps_path, 'r') as f:
-                for line in f:
-                    if MODULE_NAME in line and 'r-xp' in line:
-                        parts = line.split()
-                        if parts:
-                            addr_range = parts[0].split('-')
-                            if len(addr_range) == 2:
-                                return int(addr_range[0], 16)
-            return 0
-        except Exception:
-            return 0
+            ready, _, _ = select.select([self.sock], [], [], max(timeout, 0))
+            while ready:
+                data = self.sock.recv(4096, socket.MSG_DONTWAIT)
+                if len(data) >= 60:
+                    what = struct.unpack_from('=I', data, 36)[0]
+                    if what in (PROC_EVENT_EXEC, PROC_EVENT_COMM):
+                        self.events += 1
+                        pids.append(struct.unpack_from('=I', data, 56)[0])
+                ready, _, _ = select.select([self.sock], [], [], 0)
+            return pids
+        except BlockingIOError:
+            return pids
+        except OSError as e:
+            if e.errno == errno.ENOBUFS:
+                self.overflowed = True
+                return pids
+            self.close()
+            return None
 
-    def read_memory(self, pid, address, size):
+    def close(self):
+        if self.sock is None:
+            return
         try:
-            mem_path = f"/proc/{pid}/mem"
-            with open(mem_path, 'rb') as mem_file:
-                mem_file.seek(address)
-                return mem_file.read(size)
-        except Exception:
+            self.control(PROC_CN_MCAST_IGNORE)
+        except OSError:
+            pass
+        self.sock.close()
+        self.sock = None
+
+class MemoryHandlePool:
+
+    def __init__(self):
+        self.handles = {}
+        self.opens = 0
+        self.closes = 0
+        self.reads = 0
+        self.writes = 0
+        self.errors = 0
+
+    def open_fd(self, pid, flags):
+        fd = os.open(f"/proc/{pid}/mem", flags | os.O_CLOEXEC)
+        self.opens += 1
+        return fd
+
+    def close_fd(self, fd):
+        if fd is None:
+            return
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        self.closes += 1
+
+    def entry(self, pid, start_time):
+        entry = self.handles.get(pid)
+        if entry is not None and entry[0] != start_time:
+            self.invalidate(pid)
+            entry = None
+        if entry is None:
+            entry = [start_time, None, None]
+            self.handles[pid] = entry
+        return entry
+
+    def read(self, pid, address, size, start_time=None):
+        try:
+            entry = self.entry(pid, start_time)
+            if entry[1] is None:
+                entry[1] = self.open_fd(pid, os.O_RDONLY)
+            self.reads += 1
+            data = os.pread(entry[1], size, address)
+            if not data and size:
+                raise ProcessLookupError(pid)
+            return data if len(data) == size else None
+        except OSError as e:
+            self.errors += 1
+            if e.errno not in (errno.EIO, errno.EFAULT):
+                self.invalidate(pid)
             return None
 
-    def write_memory(self, pid, address, data):
+    def write(self, pid, address, data, start_time=None):
         try:
-            mem_path = f"/proc/{pid}/mem"
-            with open(mem_path, 'wb') as mem_file:
-                mem_file.seek(address)
-                mem_file.write(data)
-                return True
-        except Exception:
+            entry = self.entry(pid, start_time)
+            if entry[2] is None:
+                entry[2] = self.open_fd(pid, os.O_WRONLY)
+            self.writes += 1
+            written = os.pwrite(entry[2], data, address)
+            if not written and data:
+                raise ProcessLookupError(pid)
+            return written == len(data)
+        except OSError as e:
+            self.errors += 1
+            if e.errno not in (errno.EIO, errno.EFAULT):
+                self.invalidate(pid)
             return False
 
-    def get_ai_address(self, pid):
-        base_addr = self.get_base_address(pid)
-        if not base_addr:
-            return 0
+    def read_batch(self, pid, requests, start_time=None):
+        return [self.read(pid, address, size, start_time) for address, size in requests]
+
+    def read_maps(self, pid):
+        try:
+            with open(f"/proc/{pid}/maps", 'r') as f:
+                return f.read()
+        except OSError:
+            return ''
+
+    def write_batch(self, pid, writes, start_time=None):
+        return [self.write(pid, address, data, start_time) for address, data in writes]
+
+    def invalidate(self, pid):
+        entry = self.handles.pop(pid, None)
+        if entry is not None:
+            self.close_fd(entry[1])
+            self.close_fd(entry[2])
+
+    def retain(self, pids):
+        for pid in list(self.handles):
+            if pid not in pids:
+                self.invalidate(pid)
+
+    def close_all(self):
+        self.retain(())
+
+    def stats(self):
+        return {
+            "opens": self.opens,
+            "closes": self.closes,
+            "reads": self.reads,
+            "writes": self.writes,
+            "errors": self.errors,
+            "open_handles": len(self.handles),
+        }
+
+class IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+def load_vm_syscalls():
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        readv = libc.process_vm_readv
+        writev = libc.process_vm_writev
+    except (OSError, AttributeError):
+        return None
+
+    for func in (readv, writev):
+        func.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_ulong,
+                         ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong]
+        func.restype = ctypes.c_ssize_t
+
+    probe = ctypes.create_string_buffer(1)
+    local = IOVec(ctypes.addressof(probe), 1)
+    remote = IOVec(ctypes.addressof(probe), 1)
+    if readv(os.getpid(), ctypes.addressof(local), 1, ctypes.addressof(remote), 1, 0) != 1:
+        return None
+    return readv, writev
+
+class VectoredMemory:
+
+    def __init__(self, fallback=None, syscalls=None, min_batch=VM_BATCH_MIN):
+        self.fallback = fallback if fallback is not None else MemoryHandlePool()
+        self.syscalls = syscalls if syscalls is not None else load_vm_syscalls()
+        self.min_batch = min_batch
+        self.available = self.syscalls is not None
+        self.calls = 0
+        self.errors = 0
+        self.fallbacks = 0
+
+    def transfer(self, syscall, pid, buf, spans):
+        count = len(spans)
+        done = [False] * count
+        if not count:
+            return done
+
+        offsets = [0, *itertools.accumulate(size for _, size in spans)]
+        remote = ctypes.create_string_buffer(struct.pack(f"{2 * count}N", *itertools.chain.from_iterable(spans)))
+
+        base = ctypes.addressof(buf)
+        remote_base = ctypes.addressof(remote)
+        iov_size = ctypes.sizeof(IOVec)
+        index = 0
+        while index < count:
+            chunk = min(count - index, IOV_MAX)
+            local = IOVec(base + offsets[index], offsets[index + chunk] - offsets[index])
+            self.calls += 1
+            result = syscall(pid, ctypes.addressof(local), 1, remote_base + index * iov_size, chunk, 0)
+
+            if result < 0:
+                self.errors += 1
+                err = ctypes.get_errno()
+                if err in (errno.ENOSYS, errno.EPERM):
+                    self.available = False
+                    raise OSError(err, os.strerror(err))
+                if err != errno.EFAULT:
+                    if err == errno.ESRCH:
+                        self.fallback.invalidate(pid)
+                    break
+                index += 1
+                continue
+
+            if result == offsets[index + chunk] - offsets[index]:
+                done[index:index + chunk] = [True] * chunk
+                index += chunk
+                continue
+
+            end = index
+            while end < index + chunk and offsets[end + 1] - offsets[index] <= result:
+                done[end] = True
+                end += 1
+            index = end if end == index + chunk else end + 1
 
-        pointer_addr = base_addr + POINTER_OFFSET
-        pointer_data = self.read_memory(pid, pointer_addr, A_BYTES)
+        return done
 
-        if pointer_data and len(pointer_data) == A_BYTES:
-            pointer_value = struct.unpack('<I', pointer_data)[0]
-            return pointer_value + ADDRESS_OFFSET
+    def read_batch(self, pid, requests, start_time=None):
+        if len(requests) < self.min_batch:
+            return self.fallback.read_batch(pid, requests, start_time)
+        if self.available:
+            buf = ctypes.create_string_buffer(sum(size for _, size in requests) or 1)
+            try:
+                done = self.transfer(self.syscalls[0], pid, buf, requests)
+            except OSError:
+                pass
+            else:
+                raw = buf.raw
+                results = []
+                offset = 0
+                for (_, size), ok in zip(requests, done):
+                    results.append(raw[offset:offset + size] if ok else None)
+                    offset += size
+                return results
+        self.fallbacks += 1
+        return self.fallback.read_batch(pid, requests, start_time)
+
+    def write_batch(self, pid, writes, start_time=None):
+        if len(writes) < self.min_batch:
+            return self.fallback.write_batch(pid, writes, start_time)
+        if self.available:
+            payload = b''.join(data for _, data in writes)
+            buf = ctypes.create_string_buffer(payload, len(payload) or 1)
+            try:
+                done = self.transfer(self.syscalls[1], pid, buf, [(address, len(data)) for address, data in writes])
+            except OSError:
+                pass
+            else:
+                if all(done):
+                    return done
+                retry = [i for i, ok in enumerate(done) if not ok]
+                self.fallbacks += 1
+                retried = self.fallback.write_batch(pid, [writes[i] for i in retry], start_time)
+                for i, ok in zip(retry, retried):
+                    done[i] = ok
+                return done
+        self.fallbacks += 1
+        return self.fallback.write_batch(pid, writes, start_time)
+
+    def read(self, pid, address, size, start_time=None):
+        return self.read_batch(pid, [(address, size)], start_time)[0]
+
+    def write(self, pid, address, data, start_time=None):
+        return self.write_batch(pid, [(address, data)], start_time)[0]
+
+    def read_maps(self, pid):
+        return self.fallback.read_maps(pid)
+
+    def invalidate(self, pid):
+        self.fallback.invalidate(pid)
+
+    def retain(self, pids):
+        self.fallback.retain(pids)
+
+    def close_all(self):
+        self.fallback.close_all()
+
+    def stats(self):
+        stats = self.fallback.stats()
+        stats.update({
+            "backend": "process_vm" if self.available else "proc_mem",
+            "vm_calls": self.calls,
+            "vm_errors": self.errors,
+            "fallbacks": self.fallbacks,
+        })
+        return stats
+
+def create_memory_backend():
+    pool = MemoryHandlePool()
+    syscalls = load_vm_syscalls()
+    if syscalls is None:
+        return pool
+    return VectoredMemory(pool, syscalls)
+
+class HelperServer:
+
+    def __init__(self, path, uid, parent=None):
+        self.path = path
+        self.uid = uid
+        self.parent = parent
+        self.scanner = ProcessScanner()
+        self.memory = create_memory_backend()
+
+    def allowed(self, pid):
+        info = self.scanner.known.get(pid)
+        if info is None or self.scanner.read_start_time(pid) != info[0]:
+            self.scanner.scan()
+            info = self.scanner.known.get(pid)
+        return bool(info and info[1])
+
+    def handle(self, data):
+        op, pid = struct.unpack_from('<BI', data)
+        if op == HELPER_OP_SCAN:
+            pids = self.scanner.scan()
+            return struct.pack('<BH', 0, len(pids)) + b''.join(
+                struct.pack('<IQ', pid, self.scanner.start_time(pid)) for pid in pids)
+
+        if not self.allowed(pid):
+            return struct.pack('<B', 1)
+        start_time = self.scanner.start_time(pid)
+
+        if op == HELPER_OP_READ:
+            count = struct.unpack_from('<H', data, 5)[0]
+            requests = list(struct.iter_unpack('<QI', data[7:7 + count * 12]))
+            if sum(size for _, size in requests) > HELPER_MAX_REPLY - 16 - count * 4:
+                return struct.pack('<B', 1)
+            results = self.memory.read_batch(pid, requests, start_time)
+            lengths = [len(result) if result is not None else -1 for result in results]
+            return (struct.pack(f'<BH{count}i', 0, count, *lengths) +
+                    b''.join(result for result in results if result is not None))
+
+        if op == HELPER_OP_WRITE:
+            count = struct.unpack_from('<H', data, 5)[0]
+            offset = 7 + count * 12
+            writes = []
+            for address, size in struct.iter_unpack('<QI', data[7:offset]):
+                writes.append((address, data[offset:offset + size]))
+                offset += size
+            results = self.memory.write_batch(pid, writes, start_time)
+            return struct.pack(f'<BH{count}B', 0, count, *results)
+
+        if op == HELPER_OP_MAPS:
+            return struct.pack('<B', 0) + self.memory.read_maps(pid).encode()
+
+        return struct.pack('<B', 1)
+
+    def serve(self):
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        parent_fd = None
+        try:
+            umask = os.umask(0o177)
+            try:
+                listener.bind(self.path)
+            finally:
+                os.umask(umask)
+            os.chown(self.path, self.uid, -1, follow_symlinks=False)
+            listener.listen(1)
+            if self.parent:
+                try:
+                    parent_fd = os.pidfd_open(self.parent)
+                except (AttributeError, OSError):
+                    parent_fd = None
+
+            while True:
+                watched = [listener] + ([parent_fd] if parent_fd is not None else [])
+                ready, _, _ = select.select(watched, [], [])
+                if parent_fd in ready:
+                    return
+                conn, _ = listener.accept()
+                with conn:
+                    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+                    if struct.unpack('3i', creds)[1] not in (self.uid, 0):
+                        continue
+                    self.serve_client(conn, parent_fd)
+                self.memory.close_all()
+        finally:
+            listener.close()
+            if parent_fd is not None:
+                os.close(parent_fd)
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def serve_client(self, conn, parent_fd):
+        watched = [conn] + ([parent_fd] if parent_fd is not None else [])
+        while True:
+            ready, _, _ = select.select(watched, [], [])
+            if parent_fd in ready:
+                return
+            try:
+                data = conn.recv(HELPER_MAX_MESSAGE)
+            except OSError:
+                return
+            if not data:
+                return
+            try:
+                reply = self.handle(data)
+            except (struct.error, IndexError, ValueError, OSError):
+                reply = struct.pack('<B', 1)
+            try:
+                self.send_reply(conn, reply)
+            except OSError:
+                return
+
+    def send_reply(self, conn, reply):
+        reply = struct.pack('<I', len(reply)) + reply
+        for offset in range(0, len(reply), HELPER_MAX_MESSAGE):
+            conn.send(reply[offset:offset + HELPER_MAX_MESSAGE])
+
+class HelperClient:
+
+    def __init__(self, path, timeout=HELPER_CONNECT_TIMEOUT, cancel=None):
+        self.path = path
+        self.sock = None
+        self.calls = 0
+        cancel = cancel if cancel is not None else threading.Event()
+        deadline = time.monotonic() + timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+            try:
+                sock.connect(path)
+                self.sock = sock
+                return
+            except OSError:
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise
+                if cancel.wait(0.1):
+                    raise InterruptedError(f"connection to {path} cancelled")
+
+    def call(self, op, pid, payload=b''):
+        self.calls += 1
+        self.sock.send(struct.pack('<BI', op, pid) + payload)
+        parts = []
+        remaining = None
+        while remaining is None or remaining > 0:
+            part = self.sock.recv(HELPER_MAX_MESSAGE)
+            if not part:
+                raise ConnectionError("helper closed the connection")
+            if remaining is None:
+                remaining = struct.unpack_from('<I', part)[0]
+                part = part[4:]
+            parts.append(part)
+            remaining -= len(part)
+        reply = b''.join(parts)
+        if not reply or reply[0] != 0:
+            return None
+        return reply[1:]
+
+    def batches(self, items, request_size, reply_size):
+        batch = []
+        request = reply = 0
+        for item in items:
+            if batch and (len(batch) == 0xffff or request + request_size(item) > HELPER_MAX_MESSAGE - 7 or
+                          reply + reply_size(item) > HELPER_MAX_REPLY - 16):
+                yield batch
+                batch = []
+                request = reply = 0
+            batch.append(item)
+            request += request_size(item)
+            reply += reply_size(item)
+        if batch:
+            yield batch
+
+    def scan(self):
+        reply = self.call(HELPER_OP_SCAN, 0)
+        if reply is None:
+            return []
+        count = struct.unpack_from('<H', reply)[0]
+        return list(struct.iter_unpack('<IQ', reply[2:2 + count * 12]))
+
+    def read_batch(self, pid, requests):
+        if not requests:
+            return []
+        results = []
+        for batch in self.batches(requests, lambda request: 12, lambda request: request[1] + 4):
+            results.extend(self.read_group(pid, batch))
+        return results
+
+    def read_group(self, pid, requests):
+        payload = struct.pack('<H', len(requests)) + b''.join(
+            struct.pack('<QI', address, size) for address, size in requests)
+        reply = self.call(HELPER_OP_READ, pid, payload)
+        if reply is None:
+            return [None] * len(requests)
+        count = struct.unpack_from('<H', reply)[0]
+        lengths = struct.unpack_from(f'<{count}i', reply, 2)
+        offset = 2 + count * 4
+        results = []
+        for length in lengths:
+            if length < 0:
+                results.append(None)
+            else:
+                results.append(reply[offset:offset + length])
+                offset += length
+        return results
+
+    def write_batch(self, pid, writes):
+        results = []
+        for batch in self.batches(writes, lambda write: 12 + len(write[1]), lambda write: 1):
+            results.extend(self.write_group(pid, batch))
+        return results
+
+    def write_group(self, pid, writes):
+        payload = struct.pack('<H', len(writes)) + b''.join(
+            struct.pack('<QI', address, len(data)) for address, data in writes) + b''.join(
+            data for _, data in writes)
+        reply = self.call(HELPER_OP_WRITE, pid, payload)
+        if reply is None:
+            return [False] * len(writes)
+        count = struct.unpack_from('<H', reply)[0]
+        return [bool(result) for result in reply[2:2 + count]]
+
+    def read_maps(self, pid):
+        reply = self.call(HELPER_OP_MAPS, pid)
+        return reply.decode('utf-8', 'replace') if reply is not None else ''
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+class HelperScanner(ProcessScanner):
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def scan(self):
+        now = time.monotonic()
+        self.known = {pid: (start_time, True, now) for pid, start_time in self.client.scan()}
+        return sorted(self.known)
+
+class HelperMemory:
+
+    def __init__(self, client):
+        self.client = client
+
+    def read_batch(self, pid, requests, start_time=None):
+        return self.client.read_batch(pid, requests)
+
+    def write_batch(self, pid, writes, start_time=None):
+        return self.client.write_batch(pid, writes)
+
+    def read(self, pid, address, size, start_time=None):
+        return self.read_batch(pid, [(address, size)])[0]
+
+    def write(self, pid, address, data, start_time=None):
+        return self.write_batch(pid, [(address, data)])[0]
+
+    def read_maps(self, pid):
+        return self.client.read_maps(pid)
+
+    def invalidate(self, pid):
+        pass
+
+    def retain(self, pids):
+        pass
+
+    def close_all(self):
+        pass
+
+    def stats(self):
+        return {"backend": "helper", "helper_calls": self.client.calls}
+
+class SnapshotScanner(ProcessScanner):
+
+    def __init__(self, snapshot):
+        super().__init__()
+        self.snapshot = snapshot
+
+    def read_start_time(self, pid):
+        return None
+
+    def scan(self):
+        self.known = {self.snapshot.pid: (self.snapshot.start_time, True, time.monotonic())}
+        return [self.snapshot.pid]
+
+class SnapshotMemory:
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.pid, self.start_time, maps_length, index_offset, count = \
+                SNAPSHOT_HEADER.unpack_from(self.mm)
+        except struct.error:
+            magic = version = None
+        if magic != SNAPSHOT_MAGIC or version != 1:
+            self.mm.close()
+            raise ValueError(f"Not a memory snapshot: {path}")
+
+        self.maps_text = self.mm[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + maps_length].decode('utf-8', 'replace')
+        entries = list(SNAPSHOT_ENTRY.iter_unpack(self.mm[index_offset:index_offset + count * SNAPSHOT_ENTRY.size]))
+        self.starts = array.array('Q', (start for start, _, _ in entries))
+        self.ends = array.array('Q', (start + size for start, size, _ in entries))
+        self.offsets = array.array('Q', (offset for _, _, offset in entries))
+        self.view = memoryview(self.mm)
+        self.reads = 0
+        self.errors = 0
+
+    def read(self, pid, address, size, start_time=None):
+        self.reads += 1
+        index = bisect.bisect_right(self.starts, address) - 1
+        if pid != self.pid or index < 0 or address + size > self.ends[index]:
+            self.errors += 1
+            return None
+        offset = self.offsets[index] + address - self.starts[index]
+        return self.view[offset:offset + size]
+
+    def write(self, pid, address, data, start_time=None):
+        self.errors += 1
+        return False
+
+    def read_batch(self, pid, requests, start_time=None):
+        return [self.read(pid, address, size) for address, size in requests]
+
+    def write_batch(self, pid, writes, start_time=None):
+        return [self.write(pid, address, data) for address, data in writes]
+
+    def read_maps(self, pid):
+        return self.maps_text if pid == self.pid else ''
+
+    def invalidate(self, pid):
+        pass
+
+    def retain(self, pids):
+        pass
+
+    def close_all(self):
+        pass
+
+    def stats(self):
+        return {
+            "backend": "snapshot",
+            "reads": self.reads,
+            "writes": 0,
+            "errors": self.errors,
+            "regions": len(self.starts),
+        }
+
+def capture_snapshot(worker, pid, path, module=MODULE_NAME):
+    maps = worker.refresh_maps(pid)
+    regions = [(start, end) for start, end, perms, name in map(maps.region, range(len(maps)))
+               if 'r' in perms and ('w' in perms or os.path.basename(name) == module)]
+    maps_text = maps.text.encode()
+    start_time = worker.scanner.start_time(pid) or worker.scanner.read_start_time(pid) or 0
+    entries = []
+
+    with open(path, 'wb') as f:
+        f.write(bytes(SNAPSHOT_HEADER.size))
+        f.write(maps_text)
+        for start, end in regions:
+            for address in range(start, end, SNAPSHOT_BLOCK):
+                data = worker.read_memory(pid, address, min(SNAPSHOT_BLOCK, end - address))
+                if not data:
+                    continue
+                if not entries or entries[-1][0] + entries[-1][1] != address:
+                    f.write(bytes(-f.tell() % mmap.PAGESIZE))
+                    entries.append([address, 0, f.tell()])
+                f.write(data)
+                entries[-1][1] += len(data)
+
+        index_offset = f.tell()
+        for entry in entries:
+            f.write(SNAPSHOT_ENTRY.pack(*entry))
+        f.seek(0)
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, 1, pid, start_time,
+                                     len(maps_text), index_offset, len(entries)))
+    return len(entries), sum(size for _, size, _ in entries)
+
+class MemoryMap:
+
+    def __init__(self, text=''):
+        self.text = text
+        self.starts = array.array('Q')
+        self.ends = array.array('Q')
+        self.perms = []
+        self.names = []
+        self.modules = {}
+        perms_cache = {}
+
+        for line in text.splitlines():
+            parts = line.split(None, 5)
+            if len(parts) < 5:
+                continue
+            start, _, end = parts[0].partition('-')
+            try:
+                self.starts.append(int(start, 16))
+                self.ends.append(int(end, 16))
+            except ValueError:
+                continue
+            self.perms.append(perms_cache.setdefault(parts[1], parts[1]))
+            name = parts[5].rstrip() if len(parts) > 5 else ''
+            self.names.append(name)
+            if name:
+                self.modules.setdefault(os.path.basename(name), []).append(len(self.names) - 1)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def region(self, index):
+        return self.starts[index], self.ends[index], self.perms[index], self.names[index]
+
+    def find(self, address):
+        index = bisect.bisect_right(self.starts, address) - 1
+        if index >= 0 and address < self.ends[index]:
+            return index
+        return -1
+
+    def mapped(self, address, size=1, perms='r'):
+        end = address + size
+        index = self.find(address)
+        while index >= 0:
+            if not all(flag in self.perms[index] for flag in perms):
+                return False
+            if end <= self.ends[index]:
+                return True
+            index += 1
+            if index >= len(self.starts) or self.starts[index] != self.ends[index - 1]:
+                return False
+        return False
+
+    def module_regions(self, module, perms=''):
+        return [(self.starts[index], self.ends[index]) for index in self.modules.get(module, ())
+                if all(flag in self.perms[index] for flag in perms)]
+
+    def module_base(self, module, perms='r-xp'):
+        for index in self.modules.get(module, ()):
+            if self.perms[index] == perms:
+                return self.starts[index]
         return 0
 
-    def enable_ai(self, pid, address):
+class PointerChain:
+
+    def __init__(self, expression, pointer_size=A_BYTES):
+        self.expression = expression
+        self.pointer_size = pointer_size
+        tokens = CHAIN_TOKEN.findall(expression)
+        if ''.join(tokens) != ''.join(expression.split()):
+            raise ValueError(f"Invalid pointer chain: {expression!r}")
+        self.module, self.offsets, pos = self.parse(tokens, 0)
+        if pos != len(tokens):
+            raise ValueError(f"Unexpected {tokens[pos]!r} in pointer chain: {expression!r}")
+        self.levels = len(self.offsets) - 1
+
+    def parse(self, tokens, pos):
+        module = None
+        offsets = None
+        total = 0
+        sign = 1
+        expect_term = True
+
+        while pos < len(tokens):
+            token = tokens[pos]
+            if token == ']':
+                break
+
+            if not expect_term:
+                if token not in '+-':
+                    raise ValueError(f"Expected '+' or '-' before {token!r} in pointer chain: {self.expression!r}")
+                sign = -1 if token == '-' else 1
+                expect_term = True
+                pos += 1
+                continue
+
+            if token in '+-':
+                sign = -sign if token == '-' else sign
+                pos += 1
+                continue
+
+            if token == '[':
+                inner_module, inner_offsets, pos = self.parse(tokens, pos + 1)
+                if pos >= len(tokens) or tokens[pos] != ']':
+                    raise ValueError(f"Missing ']' in pointer chain: {self.expression!r}")
+                term = (inner_module, inner_offsets + [0])
+            else:
+                try:
+                    total += sign * int(token, 16)
+                    term = None
+                except ValueError:
+                    term = (token, [0])
+
+            if term is not None:
+                if offsets is not None or sign < 0:
+                    raise ValueError(f"Only one base allowed per level in pointer chain: {self.expression!r}")
+                module, offsets = term
+
+            expect_term = False
+            pos += 1
+
+        if expect_term:
+            raise ValueError(f"Incomplete pointer chain: {self.expression!r}")
+        if offsets is None:
+            offsets = [0]
+        offsets[-1] += total
+        return module, offsets, pos
+
+    def with_offsets(self, offsets):
+        chain = copy.copy(self)
+        chain.offsets = offsets
+        chain.expression = str(chain)
+        return chain
+
+    def with_root(self, offset):
+        return self.with_offsets([offset] + self.offsets[1:])
+
+    def split(self):
+        if not self.levels:
+            return self, 0
+        return self.with_offsets(self.offsets[:-1] + [0]), self.offsets[-1]
+
+    def __str__(self):
+        text = self.module or ''
+        for level, offset in enumerate(self.offsets):
+            if level:
+                text = f"[{text}]"
+            if offset or not text:
+                sign = '-' if offset < 0 else '+' if text else ''
+                text = f"{text}{sign}0x{abs(offset):x}"
+        return text
+
+@functools.lru_cache(maxsize=None)
+def compile_chain(expression, pointer_size=A_BYTES):
+    return PointerChain(expression, pointer_size)
+
+class ChainResolver:
+
+    def __init__(self, chain, worker, pid):
+        self.chain = chain
+        self.worker = worker
+        self.pid = pid
+        self.base = None
+        self.pointers = []
+        self.address = 0
+        self.reads = 0
+        self.moves = 0
+        self.provisional = False
+
+    def slot(self, level):
+        return (self.base if level == 0 else self.pointers[level - 1]) + self.chain.offsets[level]
+
+    def reset(self):
+        self.pointers = []
+        self.address = 0
+        return 0
+
+    def resolve_from(self, level):
+        del self.pointers[level:]
+        size = self.chain.pointer_size
+        for current in range(level, self.chain.levels):
+            self.reads += 1
+            data = self.worker.read_memory(self.pid, self.slot(current), size)
+            value = int.from_bytes(data, 'little') if data and len(data) == size else 0
+            if not value or not self.worker.is_mapped(self.pid, value + self.chain.offsets[current + 1]):
+                return self.reset()
+            self.pointers.append(value)
+        self.address = self.slot(self.chain.levels)
+        return self.address
+
+    def verify(self, levels):
+        size = self.chain.pointer_size
+        self.reads += len(levels)
+        values = self.worker.read_memory_batch(self.pid, [(self.slot(level), size) for level in levels])
+        for level, data in zip(levels, values):
+            if not data or int.from_bytes(data, 'little') != self.pointers[level]:
+                self.moves += 1
+                return self.resolve_from(level)
+        return self.address
+
+    def resolve(self):
+        if self.base is None:
+            if self.chain.module:
+                base = self.worker.get_base_address(self.pid, self.chain.module)
+                if not base:
+                    return 0
+                self.base = base
+            else:
+                self.base = 0
+
+        if not self.address:
+            return self.resolve_from(0)
+        if not self.chain.levels:
+            return self.address
+        return self.verify(range(self.chain.levels))
+
+class Signature:
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        tokens = pattern.split()
+        self.length = len(tokens)
+        self.runs = []
+        self.operand = None
+        self.operand_size = 0
+
+        run = bytearray()
+        for index, token in enumerate(tokens + ['?']):
+            if token in ('?', '??', '*'):
+                if run:
+                    self.runs.append((index - len(run), bytes(run)))
+                    run = bytearray()
+                if token == '*':
+                    if self.operand is None:
+                        self.operand = index
+                    elif self.operand + self.operand_size != index:
+                        raise ValueError(f"Operand bytes must be contiguous in signature: {pattern!r}")
+                    self.operand_size += 1
+            else:
+                try:
+                    run.append(int(token, 16))
+                except ValueError:
+                    raise ValueError(f"Invalid byte {token!r} in signature: {pattern!r}")
+
+        if not self.runs:
+            raise ValueError(f"Signature needs at least one literal byte: {pattern!r}")
+        self.anchor = max(self.runs, key=lambda item: len(item[1]))
+        self.checks = [item for item in self.runs if item is not self.anchor]
+
+    def find_all(self, data, base=0, stop=None):
+        anchor_offset, anchor = self.anchor
+        checks = self.checks
+        limit = len(data) - self.length
+        if stop is not None:
+            limit = min(limit, stop - base - 1)
+        matches = []
+
+        pos = data.find(anchor, anchor_offset)
+        while pos != -1:
+            start = pos - anchor_offset
+            if start > limit:
+                break
+            for offset, run in checks:
+                if data[start + offset:start + offset + len(run)] != run:
+                    break
+            else:
+                matches.append(base + start)
+            pos = data.find(anchor, pos + 1)
+        return matches
+
+@functools.lru_cache(maxsize=None)
+def compile_signature(pattern):
+    return Signature(pattern)
+
+def read_module_regions(pid, module=MODULE_NAME, perms='x'):
+    try:
+        with open(f"/proc/{pid}/maps", 'r') as f:
+            return MemoryMap(f.read()).module_regions(module, perms)
+    except OSError:
+        return []
+
+def pread_or_none(fd, size, offset):
+    try:
+        return os.pread(fd, size, offset)
+    except OSError:
+        return None
+
+def scan_range(pid, start, end, pattern, stop=None, read=None):
+    signature = compile_signature(pattern)
+    stop = end if stop is None else stop
+    if read is None:
         try:
-            data = struct.pack('B', 1)
-            return self.write_memory(pid, address, data)
-        except Exception:
-            return False
+            fd = os.open(f"/proc/{pid}/mem", os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            return []
+        try:
+            return scan_range(pid, start, end, pattern, stop, lambda address, size: pread_or_none(fd, size, address))
+        finally:
+            os.close(fd)
 
-    def run(self):
-        self.running = True
+    matches = []
+    for chunk in range(start, stop, SCAN_CHUNK):
+        data = read(chunk, min(SCAN_CHUNK + signature.length - 1, end - chunk))
+        if data is not None:
+            matches.extend(signature.find_all(bytes(data), chunk, min(chunk + SCAN_CHUNK, stop)))
+    return matches
 
-        while self.running:
-            current_pid = self.find_stronghold_pid()
+def scan_module(pid, pattern, module=MODULE_NAME, workers=None, maps=None, read=None):
+    compile_signature(pattern)
+    regions = maps.module_regions(module, 'x') if maps is not None else read_module_regions(pid, module)
+    total = sum(end - start for start, end in regions)
+
+    if read is not None or workers == 1 or total < SCAN_PARALLEL_MIN:
+        matches = []
+        for start, end in regions:
+            matches.extend(scan_range(pid, start, end, pattern, read=read))
+        return matches
+
+    import concurrent.futures
+
+    tasks = []
+    for start, end in regions:
+        for piece in range(start, end, SCAN_PARALLEL_SLICE):
+            tasks.append((piece, end, min(piece + SCAN_PARALLEL_SLICE, end)))
 
-            if not current_pid:
-                self.status_changed.emit(LANG["status_waiting_for_sh2"][current_language], False)
-                self.shpid = 0
-                self.ai_address = 0
-                time.sleep(2)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(scan_range, pid, piece, end, pattern, stop) for piece, end, stop in tasks]
+        return sorted(address for future in futures for address in future.result())
+
+class PatchStats:
+
+    def __init__(self):
+        self.checks = 0
+        self.writes = 0
+        self.elided = 0
+        self.resets = 0
+        self.failures = 0
+        self.address = 0
+        self.last_ok = None
+        self.uncorrected_total = 0.0
+        self.uncorrected_max = 0.0
+
+    def track(self, address):
+        if address != self.address:
+            self.address = address
+            self.last_ok = None
+
+    def record(self, result, now=None):
+        now = time.monotonic() if now is None else now
+        self.checks += 1
+        if result is None:
+            self.failures += 1
+            return
+        if result:
+            self.writes += 1
+            if self.last_ok is not None:
+                window = now - self.last_ok
+                self.resets += 1
+                self.uncorrected_total += window
+                self.uncorrected_max = max(self.uncorrected_max, window)
+        else:
+            self.elided += 1
+        self.last_ok = now
+
+    def stats(self):
+        return {
+            "checks": self.checks,
+            "writes": self.writes,
+            "elided": self.elided,
+            "resets": self.resets,
+            "failures": self.failures,
+            "uncorrected_avg": self.uncorrected_total / self.resets if self.resets else 0.0,
+            "uncorrected_max": self.uncorrected_max,
+        }
+
+def load_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+class ValueScanner:
+
+    def __init__(self, worker, pid, size=1, use_numpy=True):
+        if size not in SCAN_VALUE_SIZES:
+            raise ValueError(f"Value size must be one of {SCAN_VALUE_SIZES}")
+        self.worker = worker
+        self.pid = pid
+        self.size = size
+        self.numpy = load_numpy() if use_numpy else None
+        self.maps = None
+        self.snapshot = {}
+        self.candidates = None
+        self.slot_masks = {}
+
+    def blocks(self):
+        self.maps = self.worker.refresh_maps(self.pid)
+        for index in range(len(self.maps)):
+            start, end, perms, _ = self.maps.region(index)
+            if 'r' in perms and 'w' in perms:
+                for address in range(start, end, SNAPSHOT_BLOCK):
+                    yield address, min(SNAPSHOT_BLOCK, end - address)
+
+    def read_blocks(self, blocks):
+        data = {}
+        for address, size in blocks:
+            chunk = self.worker.read_memory(self.pid, address, size)
+            if chunk is not None:
+                data[address] = chunk
+        return data
+
+    def start(self):
+        self.snapshot = self.read_blocks(self.blocks())
+        self.candidates = None
+        return self.count()
+
+    def narrow(self, comparison, value=None):
+        if comparison not in ("changed", "unchanged", "equal"):
+            raise ValueError(f"Unknown comparison {comparison!r}")
+        if comparison == "equal":
+            value %= 1 << (8 * self.size)
+
+        current = self.read_blocks((address, len(data)) for address, data in self.snapshot.items())
+        candidates = {}
+        for address, data in current.items():
+            previous = self.snapshot[address]
+            if len(previous) != len(data):
                 continue
+            if self.numpy is not None:
+                mask = self.compare_numpy(previous, data, comparison, value)
+            else:
+                mask = self.compare_python(previous, data, comparison, value)
+            if self.candidates is not None:
+                mask &= self.candidates[address]
+            if self.numpy is not None and mask.any() or self.numpy is None and mask:
+                candidates[address] = mask
+
+        self.snapshot = {address: current[address] for address in candidates}
+        self.candidates = candidates
+        return self.count()
+
+    def compare_numpy(self, previous, data, comparison, value):
+        np = self.numpy
+        dtype = np.dtype(f'<u{self.size}')
+        count = len(data) // self.size
+        new = np.frombuffer(data, dtype, count)
+        if comparison == "equal":
+            return np.packbits(new == value)
+        old = np.frombuffer(previous, dtype, count)
+        return np.packbits(new != old if comparison == "changed" else new == old)
+
+    def slot_mask(self, count):
+        mask = self.slot_masks.get(count)
+        if mask is None:
+            mask = int.from_bytes((b'\x01' + bytes(self.size - 1)) * count, 'little')
+            self.slot_masks[count] = mask
+        return mask
+
+    def compare_python(self, previous, data, comparison, value):
+        count = len(data) // self.size
+        length = count * self.size
+        if comparison == "equal":
+            other = int.from_bytes(value.to_bytes(self.size, 'little') * count, 'little')
+        else:
+            other = int.from_bytes(previous[:length], 'little')
+        diff = int.from_bytes(data[:length], 'little') ^ other
+        diff |= diff >> 4
+        diff |= diff >> 2
+        diff |= diff >> 1
+        shift = 8
+        while shift < self.size * 8:
+            diff |= diff >> shift
+            shift *= 2
+        slots = self.slot_mask(count)
+        changed = diff & slots
+        return changed if comparison == "changed" else slots ^ changed
+
+    def count(self):
+        if self.candidates is None:
+            return sum(len(data) // self.size for data in self.snapshot.values())
+        if self.numpy is not None:
+            return sum(int(self.numpy.unpackbits(mask).sum()) for mask in self.candidates.values())
+        return sum(bin(mask).count('1') for mask in self.candidates.values())
+
+    def addresses(self, limit=SCAN_LIST_LIMIT):
+        found = []
+        for block in sorted(self.candidates or ()):
+            mask = self.candidates[block]
+            if self.numpy is not None:
+                offsets = self.numpy.flatnonzero(self.numpy.unpackbits(mask))[:limit - len(found)]
+                found.extend(block + int(offset) * self.size for offset in offsets)
+            else:
+                while mask and len(found) < limit:
+                    low = mask & -mask
+                    found.append(block + (low.bit_length() - 1) // 8)
+                    mask ^= low
+            if len(found) >= limit:
+                break
+        return found
+
+    def describe(self, address):
+        index = self.maps.find(address)
+        if index < 0:
+            return f"0x{address:x}"
+        start, _, perms, name = self.maps.region(index)
+        module = os.path.basename(name)
+        if module in self.maps.modules:
+            return f"0x{address:x}  {module}+0x{address - self.maps.module_regions(module)[0][0]:x}"
+        return f"0x{address:x}  [{perms} {name or 'anon'} +0x{address - start:x}]"
+
+class PointerMap:
+
+    def __init__(self, values, slots, module, base, static, pointer_size=A_BYTES):
+        self.values = values
+        self.slots = slots
+        self.module = module
+        self.base = base
+        self.static = static
+        self.pointer_size = pointer_size
+
+    def __len__(self):
+        return len(self.values)
+
+    def referrers(self, target, max_offset):
+        low = bisect.bisect_left(self.values, max(target - max_offset, 0))
+        high = bisect.bisect_right(self.values, target)
+        return [(self.slots[index], target - self.values[index]) for index in range(low, high)]
+
+    def is_static(self, slot):
+        return any(start <= slot < end for start, end in self.static)
+
+    def expression(self, root, offsets):
+        sign = '-' if root < 0 else '+'
+        text = f"{self.module}{sign}0x{abs(root):x}"
+        for offset in offsets:
+            text = f"[{text}]+0x{offset:x}"
+        return text
+
+def collect_pointers_numpy(np, blocks, starts, ends, pointer_size):
+    starts = np.array(starts, dtype=np.uint64)
+    ends = np.array(ends, dtype=np.uint64)
+    values = []
+    slots = []
+    for address, data in blocks:
+        found = np.frombuffer(data, f'<u{pointer_size}', len(data) // pointer_size).astype(np.uint64)
+        index = np.searchsorted(starts, found, side='right').astype(np.int64) - 1
+        valid = (index >= 0) & (found < ends[index.clip(0)])
+        positions = np.flatnonzero(valid)
+        values.append(found[positions])
+        slots.append(np.uint64(address) + positions.astype(np.uint64) * np.uint64(pointer_size))
+    if not values:
+        return array.array('Q'), array.array('Q')
+    values = np.concatenate(values)
+    slots = np.concatenate(slots)
+    order = np.argsort(values, kind='stable')
+    return (array.array('Q', values[order].astype('<u8').tobytes()),
+            array.array('Q', slots[order].astype('<u8').tobytes()))
+
+def collect_pointers_python(blocks, starts, ends, pointer_size):
+    typecode = 'I' if pointer_size == 4 else 'Q'
+    low, high = starts[0], ends[-1]
+    pairs = []
+    for address, data in blocks:
+        words = array.array(typecode)
+        words.frombytes(data[:len(data) - len(data) % pointer_size])
+        for position, value in enumerate(words):
+            if low <= value < high:
+                index = bisect.bisect_right(starts, value) - 1
+                if index >= 0 and value < ends[index]:
+                    pairs.append((value, address + position * pointer_size))
+    pairs.sort()
+    return array.array('Q', (value for value, _ in pairs)), array.array('Q', (slot for _, slot in pairs))
+
+def build_pointer_map(worker, pid, module=MODULE_NAME, pointer_size=A_BYTES, use_numpy=True):
+    maps = worker.refresh_maps(pid)
+    static = maps.module_regions(module)
+    base = maps.module_base(module)
+    if not static or not base:
+        return None
+
+    readable = [maps.region(index) for index in range(len(maps)) if 'r' in maps.perms[index]]
+    starts = [start for start, _, _, _ in readable]
+    ends = [end for _, end, _, _ in readable]
+    scanned = [(start, end) for start, end, perms, _ in readable if 'w' in perms] + static
+
+    def blocks():
+        for start, end in scanned:
+            for address in range(start, end, SNAPSHOT_BLOCK):
+                data = worker.read_memory(pid, address, min(SNAPSHOT_BLOCK, end - address))
+                if data is not None:
+                    yield address, data
+
+    np = load_numpy() if use_numpy else None
+    if np is not None:
+        values, slots = collect_pointers_numpy(np, blocks(), starts, ends, pointer_size)
+    else:
+        values, slots = collect_pointers_python(blocks(), starts, ends, pointer_size)
+    return PointerMap(values, slots, module, base, static, pointer_size)
+
+def search_pointer_paths(pointer_map, slot, offsets, depth, max_depth, max_offset, limit):
+    if pointer_map.is_static(slot):
+        return [(slot - pointer_map.base, tuple(offsets))]
+    paths = []
+    if depth >= max_depth:
+        return paths
+    for referrer, offset in pointer_map.referrers(slot, max_offset):
+        paths.extend(search_pointer_paths(pointer_map, referrer, [offset] + offsets, depth + 1,
+                                          max_depth, max_offset, limit - len(paths)))
+        if len(paths) >= limit:
+            break
+    return paths
+
+POINTER_SCAN_STATE = {}
+
+def init_pointer_search(pointer_map):
+    POINTER_SCAN_STATE["map"] = pointer_map
+
+def search_pointer_branches(branches, max_depth, max_offset, limit):
+    pointer_map = POINTER_SCAN_STATE["map"]
+    paths = []
+    for slot, offset in branches:
+        paths.extend(search_pointer_paths(pointer_map, slot, [offset], 1, max_depth, max_offset, limit - len(paths)))
+        if len(paths) >= limit:
+            break
+    return paths
+
+def scan_pointer_paths(pointer_map, target, max_depth=POINTER_SCAN_DEPTH, max_offset=POINTER_SCAN_OFFSET,
+                       limit=POINTER_SCAN_LIMIT, workers=None):
+    branches = pointer_map.referrers(target, max_offset)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(branches) < 2:
+        init_pointer_search(pointer_map)
+        paths = search_pointer_branches(branches, max_depth, max_offset, limit)
+    else:
+        import concurrent.futures
+        import multiprocessing
+
+        shares = [branches[index::workers] for index in range(workers)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                                    initializer=init_pointer_search,
+                                                    initargs=(pointer_map,)) as pool:
+            futures = [pool.submit(search_pointer_branches, share, max_depth, max_offset, limit)
+                       for share in shares if share]
+            paths = [path for future in futures for path in future.result()]
+
+    unique = sorted(set(paths), key=lambda path: (len(path[1]), abs(path[0]), path[1]))
+    return [pointer_map.expression(root, offsets) for root, offsets in unique[:limit]]
+
+def verify_pointer_paths(worker, pid, expressions, target):
+    valid = []
+    for expression in expressions:
+        chain = compile_chain(expression)
+        if ChainResolver(chain, worker, pid).resolve() == target:
+            valid.append(expression)
+    return valid
+
+class PatchEntry:
+
+    def __init__(self, spec):
+        try:
+            self.name = str(spec["name"])
+            expression = spec["chain"]
+            value = spec["value"]
+        except (KeyError, TypeError):
+            raise ValueError(f"Patch entries need name, chain and value: {spec!r}")
+        for field in ("chain", "signature", "type", "mode"):
+            value_type = type(spec.get(field))
+            if value_type is not str and (value_type is not type(None) or field == "chain"):
+                raise ValueError(f"Field {field!r} of patch {self.name!r} must be a string: {spec[field]!r}")
+
+        self.chain = compile_chain(expression)
+        self.base_chain, self.offset = self.chain.split()
+        self.signature = spec.get("signature")
+        if self.signature:
+            compile_signature(self.signature)
+        self.type = spec.get("type", "u8")
+        self.mode = spec.get("mode", "enforce")
+        if self.mode not in PATCH_MODES:
+            raise ValueError(f"Unknown mode {self.mode!r} in patch {self.name!r}")
 
-            if current_pid != self.shpid:
-                self.shpid = current_pid
-                self.ai_address = self.get_ai_address(self.shpid)
+        try:
+            if self.type == "bytes":
+                self.data = bytes.fromhex(value)
+            elif self.type in PATCH_TYPES:
+                self.data = struct.pack(PATCH_TYPES[self.type], value)
+            else:
+                raise ValueError(f"Unknown type {self.type!r} in patch {self.name!r}")
+        except (struct.error, TypeError) as e:
+            raise ValueError(f"Invalid value {value!r} in patch {self.name!r}: {e}")
+        if not self.data:
+            raise ValueError(f"Empty value in patch {self.name!r}")
+
+        self.adaptive = "min_rate" in spec or "max_rate" in spec
+        rates = {}
+        for field in ("rate", "min_rate", "max_rate"):
+            try:
+                rates[field] = float(spec[field]) if field in spec else None
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid {field} {spec[field]!r} in patch {self.name!r}")
+        rate = rates["rate"] if rates["rate"] is not None else 1.0 / PATCH_INTERVAL
+        self.min_rate = rates["min_rate"] if rates["min_rate"] is not None else min(rate, rates["max_rate"] or rate)
+        self.max_rate = rates["max_rate"] if rates["max_rate"] is not None else max(rate, self.min_rate)
+        self.rate = rate if rates["rate"] is not None else min(max(rate, self.min_rate), self.max_rate)
+        if not 0 < self.min_rate <= self.rate <= self.max_rate <= FREEZE_MAX_RATE:
+            raise ValueError(f"Rates of patch {self.name!r} must satisfy 0 < min_rate <= rate <= max_rate "
+                             f"<= {FREEZE_MAX_RATE:g} Hz")
+        self.interval = 1.0 / self.rate
+        self.min_interval = 1.0 / self.max_rate
+        self.max_interval = 1.0 / self.min_rate
+
+        self.key = (str(self.base_chain), self.signature)
+        self.definition = (self.key, self.data, self.mode, self.rate, self.min_rate, self.max_rate)
+
+class PatchTable:
+
+    def __init__(self, path=None):
+        self.path = path
+        self.mtime = self.stat()
+        specs = DEFAULT_PATCHES
+        if path is not None:
+            with open(path, 'r', encoding='utf-8') as f:
+                specs = json.load(f)
+        if not isinstance(specs, list):
+            raise ValueError(f"Patch table must be a list of entries: {path}")
+
+        self.entries = [PatchEntry(spec) for spec in specs]
+        names = [entry.name for entry in self.entries]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate patch names in {path}")
+
+    def stat(self):
+        if self.path is None:
+            return None
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
 
-                if self.ai_address:
-                    self.status_changed.emit(LANG["status_sh2_found"][current_language].format(pid=self.shpid), True)
-                else:
-                    self.status_changed.emit(LANG["status_failed_to_get_ai_address"][current_language], False)
-                    time.sleep(2)
+    def changed(self):
+        return self.path is not None and self.stat() != self.mtime
+
+class PatchState:
+
+    def __init__(self, entry):
+        self.entry = entry
+        self.address = 0
+        self.applied = 0
+        self.deadline = 0.0
+        self.retries = 0
+        self.interval = entry.interval
+        self.result = None
+        self.stats = PatchStats()
+
+    def adapt(self, phase):
+        entry = self.entry
+        if not entry.adaptive:
+            return self.interval
+        if phase == "lobby":
+            self.interval = entry.min_interval
+        elif self.result:
+            self.interval = max(self.interval / ADAPT_TIGHTEN, entry.min_interval)
+        elif self.result is not None:
+            growth = ADAPT_MATCH_GROWTH if phase == "match" else ADAPT_GROWTH
+            self.interval = min(self.interval * growth, entry.max_interval)
+        return self.interval
+
+class ValueSeries:
+
+    def __init__(self, typecode, capacity=RECORDER_CAPACITY):
+        self.capacity = capacity
+        self.deltas = array.array('I', bytes(4 * capacity))
+        self.values = array.array(typecode, bytes(array.array(typecode).itemsize * capacity))
+        self.head = 0
+        self.count = 0
+        self.first_ms = 0
+        self.last_ms = 0
+
+    def append(self, ms, value):
+        delta = min(max(ms - self.last_ms, 0), 0xffffffff) if self.count else 0
+        if self.count == self.capacity:
+            self.first_ms += self.deltas[(self.head + 1) % self.capacity]
+        else:
+            self.count += 1
+        if self.count == 1:
+            self.first_ms = ms
+        self.deltas[self.head] = delta
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.last_ms = self.last_ms + delta if self.count > 1 else ms
+
+    def indices(self):
+        start = (self.head - self.count) % self.capacity
+        return [(start + offset) % self.capacity for offset in range(self.count)]
+
+    def samples(self):
+        ms = self.first_ms
+        for position, index in enumerate(self.indices()):
+            if position:
+                ms += self.deltas[index]
+            yield ms, self.values[index]
+
+    def latest(self, limit):
+        return [self.values[index] for index in self.indices()[-limit:]]
+
+class ValueRecorder:
+
+    def __init__(self, rate=RECORDER_RATE, capacity=RECORDER_CAPACITY, max_series=RECORDER_MAX_SERIES):
+        self.interval = 1.0 / rate
+        self.active = True
+        self.capacity = capacity
+        self.max_series = max_series
+        self.series = {}
+        self.latest_key = None
+        self.lock = threading.Lock()
+        self.clock_offset = time.time() - time.monotonic()
+
+    def record(self, pid, entry, when, data):
+        key = (pid, entry.name)
+        typecode = PATCH_TYPES[entry.type][-1]
+        value = struct.unpack(PATCH_TYPES[entry.type], data)[0]
+        with self.lock:
+            series = self.series.get(key)
+            if series is None or series.values.typecode != typecode:
+                if series is None and len(self.series) >= self.max_series:
+                    del self.series[next(iter(self.series))]
+                series = ValueSeries(typecode, self.capacity)
+                self.series[key] = series
+            series.append(int(when * 1000), value)
+            self.latest_key = key
+
+    def latest(self, limit):
+        with self.lock:
+            series = self.series.get(self.latest_key)
+            return (self.latest_key, series.latest(limit)) if series is not None else (None, [])
+
+    def export(self, path):
+        with self.lock:
+            if path.lower().endswith('.csv'):
+                self.export_csv(path)
+            else:
+                self.export_binary(path)
+
+    def export_csv(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("pid,name,time,value\n")
+            for (pid, name), series in self.series.items():
+                for ms, value in series.samples():
+                    f.write(f"{pid},{name},{ms / 1000 + self.clock_offset:.3f},{value}\n")
+
+    def export_binary(self, path):
+        with open(path, 'wb') as f:
+            f.write(RECORDER_MAGIC + struct.pack('<BH', 1, len(self.series)))
+            for (pid, name), series in self.series.items():
+                indices = series.indices()
+                deltas = array.array('I', (series.deltas[index] for index in indices))
+                values = array.array(series.values.typecode, (series.values[index] for index in indices))
+                if deltas:
+                    deltas[0] = 0
+                encoded = name.encode()
+                f.write(struct.pack(f'<IB{len(encoded)}scdI', pid, len(encoded), encoded,
+                                    series.values.typecode.encode(),
+                                    series.first_ms / 1000 + self.clock_offset, series.count))
+                f.write(deltas.tobytes())
+                f.write(values.tobytes())
+
+class Histogram:
+
+    def __init__(self, buckets=METRICS_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.errors = 0
+
+    def observe(self, seconds, ok=True):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        if not ok:
+            self.errors += 1
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+class Metrics:
+
+    def __init__(self):
+        self.stages = {stage: Histogram() for stage in METRICS_STAGES}
+        self.counters = dict.fromkeys(METRICS_COUNTERS, 0)
+        self.targets = 0
+        self.patches = {}
+
+    def observe(self, stage, start, ok=True):
+        self.stages[stage].observe(time.perf_counter() - start, ok)
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+    def render(self):
+        lines = [
+            "# HELP stronghold2_stage_seconds Time spent in each worker stage.",
+            "# TYPE stronghold2_stage_seconds histogram",
+        ]
+        for stage, histogram in self.stages.items():
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'stronghold2_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'stronghold2_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+            lines.append(f'stronghold2_stage_seconds_sum{{stage="{stage}"}} {histogram.total}')
+            lines.append(f'stronghold2_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+        lines.append("# HELP stronghold2_stage_errors_total Failed operations in each worker stage.")
+        lines.append("# TYPE stronghold2_stage_errors_total counter")
+        for stage, histogram in self.stages.items():
+            lines.append(f'stronghold2_stage_errors_total{{stage="{stage}"}} {histogram.errors}')
+
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE stronghold2_{name}_total counter")
+            lines.append(f"stronghold2_{name}_total {value}")
+
+        lines.append("# TYPE stronghold2_targets gauge")
+        lines.append(f"stronghold2_targets {self.targets}")
+
+        patches = [(pid, name.replace('\\', '\\\\').replace('"', '\\"'), stats.stats())
+                   for (pid, name), stats in sorted(self.patches.items())]
+        for name in ("checks", "writes", "elided", "resets", "failures"):
+            lines.append(f"# TYPE stronghold2_patch_{name}_total counter")
+            for pid, patch, stats in patches:
+                lines.append(f'stronghold2_patch_{name}_total{{pid="{pid}",patch="{patch}"}} {stats[name]}')
+        lines.append("# HELP stronghold2_patch_uncorrected_seconds Time a reset value stayed uncorrected.")
+        lines.append("# TYPE stronghold2_patch_uncorrected_seconds gauge")
+        for pid, patch, stats in patches:
+            for name in ("avg", "max"):
+                lines.append(f'stronghold2_patch_uncorrected_seconds{{pid="{pid}",patch="{patch}",stat="{name}"}} '
+                             f'{stats["uncorrected_" + name]}')
+        return '\n'.join(lines) + '\n'
+
+def serve_metrics(metrics, port, host='127.0.0.1'):
+    import http.server
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+class EventLog:
+
+    def __init__(self, path=None, capacity=EVENT_LOG_CAPACITY, max_bytes=EVENT_LOG_MAX_BYTES,
+                 backups=EVENT_LOG_BACKUPS):
+        self.pending = collections.deque(maxlen=capacity)
+        self.entries = collections.deque(maxlen=capacity)
+        self.capacity = capacity
+        self.sequence = 0
+        self.lock = threading.Lock()
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.sink = None
+
+    def emit(self, level, event, **fields):
+        self.pending.append((time.time(), level, event, fields))
+
+    def drain(self):
+        if not self.lock.acquire(blocking=False):
+            return 0
+        try:
+            count = 0
+            lines = []
+            pending = self.pending
+            while pending:
+                when, level, event, fields = pending.popleft()
+                self.sequence += 1
+                count += 1
+                self.entries.append((self.sequence, when, level, event, fields))
+                if self.path is not None:
+                    lines.append(json.dumps(dict(fields, time=when, level=level, event=event), default=str))
+            if lines:
+                self.write(lines)
+            return count
+        finally:
+            self.lock.release()
+
+    def write(self, lines):
+        try:
+            if self.sink is None:
+                self.sink = open(self.path, 'a', encoding='utf-8')
+            self.sink.write('\n'.join(lines) + '\n')
+            self.sink.flush()
+            if self.sink.tell() >= self.max_bytes:
+                self.rotate()
+        except OSError as e:
+            self.close()
+            self.emit("error", "log_sink_failed", path=self.path, error=str(e))
+            self.path = None
+
+    def rotate(self):
+        self.close()
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def since(self, sequence):
+        entries = list(self.entries)
+        if not entries:
+            return entries
+        return entries[max(sequence + 1 - entries[0][0], 0):]
+
+    def close(self):
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+class GameTarget:
+
+    def __init__(self, pid, start_time):
+        self.pid = pid
+        self.start_time = start_time
+        self.pidfd = None
+        self.resolvers = {}
+        self.signatures = {}
+        self.patches = {}
+        self.found = False
+        self.active = False
+        self.alive = True
+        self.phase = None
+
+    def open_pidfd(self, scanner):
+        try:
+            pidfd = os.pidfd_open(self.pid)
+        except (AttributeError, OSError):
+            return
+        if scanner.read_start_time(self.pid) != self.start_time:
+            os.close(pidfd)
+            return
+        self.pidfd = pidfd
+
+    def close(self):
+        self.alive = False
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+
+class Signal:
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+class Stronghold2Worker:
+
+    def __init__(self, use_proc_connector=True, helper_path=None, metrics=None, patch_path=None, recorder=None,
+                 snapshot_path=None, log=None):
+        self.status_changed = Signal()
+        self.ai_enabled = Signal()
+        self.error_occurred = Signal()
+        self.thread = None
+        self.running = False
+        self.stopping = threading.Event()
+        self.loop = None
+        self.waiter = None
+        self.rescan = False
+        self.last_status = None
+        self.use_proc_connector = use_proc_connector
+        self.helper_path = helper_path
+        self.helper = None
+        self.connector = None
+        self.connector_fd = None
+        self.targets = {}
+        self.schedule = []
+        self.sequence = itertools.count()
+        self.scanner = ProcessScanner()
+        self.memory = create_memory_backend()
+        self.maps = {}
+        self.metrics = metrics if metrics is not None else Metrics()
+        if patch_path is None and os.path.exists(PATCH_TABLE_FILE):
+            patch_path = PATCH_TABLE_FILE
+        self.patch_path = patch_path
+        self.patches = None
+        self.recorder = recorder
+        self.log = log if log is not None else EventLog()
+        if snapshot_path is not None:
+            self.memory = SnapshotMemory(snapshot_path)
+            self.scanner = SnapshotScanner(self.memory)
+            self.use_proc_connector = False
+
+    def find_stronghold_pids(self):
+        start = time.perf_counter()
+        pids = self.scanner.scan()
+        self.metrics.observe("discovery", start)
+        return pids
+
+    def find_stronghold_pid(self):
+        pids = self.find_stronghold_pids()
+        return pids[0] if pids else 0
+
+    def connect_helper(self):
+        if not self.helper_path or self.helper is not None:
+            return True
+        try:
+            self.helper = HelperClient(self.helper_path, cancel=self.stopping)
+        except InterruptedError:
+            return False
+        except OSError as e:
+            self.log.emit("error", "helper_failed", path=self.helper_path, error=str(e))
+            self.error_occurred.emit(str(e))
+            return False
+        self.scanner = HelperScanner(self.helper)
+        self.memory = HelperMemory(self.helper)
+        return True
+
+    def close_helper(self):
+        if self.helper is not None:
+            self.helper.close()
+            self.helper = None
+            self.scanner = ProcessScanner()
+            self.memory = create_memory_backend()
+
+    def watch(self, fd, callback, *args):
+        if self.loop is not None:
+            self.loop.add_reader(fd, callback, *args)
+
+    def unwatch(self, fd):
+        if self.loop is not None:
+            self.loop.remove_reader(fd)
+
+    def open_connector(self):
+        if self.use_proc_connector and self.connector is None:
+            connector = ProcConnector()
+            if connector.open():
+                self.connector = connector
+                self.connector_fd = connector.sock.fileno()
+                self.watch(self.connector_fd, self.on_connector)
+            else:
+                self.log.emit("warning", "connector_unavailable")
+
+    def close_connector(self):
+        if self.connector is not None:
+            self.unwatch(self.connector_fd)
+            self.connector.close()
+            self.connector = None
+
+    def needs_polling(self):
+        return self.connector is None or any(target.pidfd is None for target in self.targets.values())
+
+    def add_target(self, pid):
+        target = GameTarget(pid, self.scanner.start_time(pid))
+        target.open_pidfd(self.scanner)
+        if target.pidfd is not None:
+            self.watch(target.pidfd, self.on_target_exit, pid)
+        self.sync_patches(target)
+        self.targets[pid] = target
+        self.metrics.targets = len(self.targets)
+        self.publish_patch_stats()
+        self.log.emit("info", "target_added", pid=pid, pidfd=target.pidfd is not None)
+        return target
+
+    def remove_target(self, pid):
+        target = self.targets.pop(pid, None)
+        if target is not None:
+            if target.pidfd is not None:
+                self.unwatch(target.pidfd)
+            target.close()
+            self.memory.invalidate(pid)
+            for name, state in target.patches.items():
+                self.log.emit("info", "patch_stats", pid=pid, name=name, **state.stats.stats())
+            self.log.emit("info", "target_removed", pid=pid)
+        self.maps.pop(pid, None)
+        self.metrics.targets = len(self.targets)
+        self.publish_patch_stats()
+
+    def publish_patch_stats(self):
+        self.metrics.patches = {(pid, name): state.stats for pid, target in self.targets.items()
+                                for name, state in target.patches.items()}
+
+    def schedule_patch(self, target, state, deadline):
+        state.deadline = deadline
+        heapq.heappush(self.schedule, (deadline, next(self.sequence), target, state))
+
+    def reschedule_patches(self, target, states, now):
+        for state in states:
+            if not state.address:
+                delay = min(RETRY_MIN_INTERVAL * 2 ** state.retries, RETRY_INTERVAL)
+                if delay < RETRY_INTERVAL:
+                    state.retries += 1
+                self.schedule_patch(target, state, now + delay)
+                continue
+            state.retries = 0
+            interval = state.adapt(target.phase)
+            deadline = state.deadline + interval
+            if deadline <= now:
+                deadline = now + interval
+            self.schedule_patch(target, state, deadline)
+
+    def expedite_patches(self, target, states, now):
+        for state in target.patches.values():
+            if state.entry.adaptive and state.address and state not in states:
+                interval = state.adapt(target.phase)
+                if state.deadline > now + interval:
+                    self.schedule_patch(target, state, now + interval)
+
+    def pop_due_patches(self, now):
+        due = {}
+        while self.schedule and self.schedule[0][0] <= now + FREEZE_SLACK:
+            deadline, _, target, state = heapq.heappop(self.schedule)
+            if target.alive and target.patches.get(state.entry.name) is state and state.deadline == deadline:
+                due.setdefault(target, []).append(state)
+        return due
+
+    def sync_targets(self):
+        pids = self.find_stronghold_pids()
+        current = set(pids)
+        for pid, target in list(self.targets.items()):
+            if pid not in current or target.start_time != self.scanner.start_time(pid):
+                self.remove_target(pid)
+        for pid in pids:
+            if pid not in self.targets:
+                self.add_target(pid)
+
+    def notify(self, key, is_success, **fields):
+        status = (LANG[key][current_language].format(**fields), is_success)
+        if status != self.last_status:
+            self.last_status = status
+            self.status_changed.emit(*status)
+
+    def report_waiting(self):
+        if not self.targets:
+            self.notify("status_waiting_for_sh2", False)
+
+    def wake(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def on_target_exit(self, pid):
+        self.remove_target(pid)
+        self.wake()
+
+    def on_connector(self):
+        pids = self.connector.wait(0)
+        if pids is None:
+            self.loop.remove_reader(self.connector_fd)
+            self.connector = None
+            self.rescan = True
+            self.log.emit("warning", "connector_lost")
+        elif self.connector.overflowed:
+            self.connector.overflowed = False
+            self.rescan = True
+        else:
+            for pid in pids:
+                if pid in self.targets:
                     continue
+                self.scanner.forget(pid)
+                result = self.scanner.inspect(pid)
+                if result and result[1]:
+                    self.rescan = True
+        if self.rescan:
+            self.wake()
+
+    async def wait_events(self, timeout):
+        if not self.rescan and self.running:
+            self.waiter = self.loop.create_future()
+            timer = self.loop.call_later(max(timeout, 0), self.wake)
+            try:
+                await self.waiter
+            finally:
+                timer.cancel()
+                self.waiter = None
+        rescan, self.rescan = self.rescan, False
+        return rescan
+
+    def refresh_maps(self, pid):
+        start = time.perf_counter()
+        text = self.memory.read_maps(pid)
+        maps = self.maps.get(pid)
+        if maps is None or maps.text != text:
+            maps = MemoryMap(text)
+            self.maps[pid] = maps
+        self.metrics.observe("maps", start, bool(text))
+        return maps
+
+    def get_maps(self, pid):
+        maps = self.maps.get(pid)
+        return maps if maps is not None else self.refresh_maps(pid)
+
+    def is_mapped(self, pid, address, size=1, perms='r'):
+        if self.get_maps(pid).mapped(address, size, perms):
+            return True
+        return self.refresh_maps(pid).mapped(address, size, perms)
+
+    def get_base_address(self, pid, module=MODULE_NAME):
+        base = self.refresh_maps(pid).module_base(module)
+        if not base:
+            self.log.emit("warning", "module_missing", pid=pid, module=module)
+        return base
+
+    def read_memory(self, pid, address, size):
+        start = time.perf_counter()
+        data = self.memory.read(pid, address, size, self.scanner.start_time(pid))
+        self.metrics.observe("read", start, data is not None)
+        if data is None:
+            self.log.emit("warning", "read_failed", pid=pid, address=address, size=size)
+        return data
+
+    def write_memory(self, pid, address, data):
+        start = time.perf_counter()
+        ok = self.memory.write(pid, address, data, self.scanner.start_time(pid))
+        self.metrics.observe("write", start, ok)
+        if not ok:
+            self.log.emit("warning", "write_failed", pid=pid, address=address, size=len(data))
+        return ok
+
+    def read_memory_batch(self, pid, requests):
+        start = time.perf_counter()
+        results = self.memory.read_batch(pid, requests, self.scanner.start_time(pid))
+        self.metrics.observe("read", start, None not in results)
+        if None in results:
+            index = results.index(None)
+            self.log.emit("warning", "read_failed", pid=pid, address=requests[index][0], size=requests[index][1],
+                          failed=results.count(None), batch=len(results))
+        return results
+
+    def write_memory_batch(self, pid, writes):
+        start = time.perf_counter()
+        results = self.memory.write_batch(pid, writes, self.scanner.start_time(pid))
+        self.metrics.observe("write", start, all(results))
+        if not all(results):
+            failed = [index for index, ok in enumerate(results) if not ok]
+            address, data = writes[failed[0]]
+            self.log.emit("warning", "write_failed", pid=pid, address=address, size=len(data),
+                          failed=len(failed), batch=len(results))
+        return results
+
+    def find_pointer_offset(self, pid, pattern, module=MODULE_NAME):
+        signature = compile_signature(pattern)
+        if signature.operand is None:
+            return 0
+
+        base_addr = self.get_base_address(pid, module)
+        if not base_addr:
+            return 0
+
+        offsets = set()
+        for match in scan_module(pid, pattern, module, maps=self.get_maps(pid),
+                                 read=lambda address, size: self.read_memory(pid, address, size)):
+            data = self.read_memory(pid, match + signature.operand, signature.operand_size)
+            if data:
+                offsets.add(int.from_bytes(data, 'little') - base_addr)
+        return offsets.pop() if len(offsets) == 1 else 0
 
-            if self.ai_address and self.enable_ai(self.shpid, self.ai_address):
-                self.ai_enabled.emit()
+    def load_patches(self):
+        try:
+            table = PatchTable(self.patch_path)
+        except (OSError, ValueError) as e:
+            self.log.emit("error", "patch_table_error", path=self.patch_path, error=str(e))
+            self.error_occurred.emit(LANG["status_patch_table_error"][current_language].format(e))
+            return False
+        self.patches = table
+        self.log.emit("info", "patch_table_loaded", path=self.patch_path, entries=len(table.entries))
+        for target in self.targets.values():
+            self.sync_patches(target)
+        return True
+
+    def reload_patches(self):
+        if self.patches is not None and self.patches.changed():
+            self.patches.mtime = self.patches.stat()
+            self.load_patches()
+
+    def sync_patches(self, target):
+        if self.patches is None:
+            return
+        now = time.monotonic()
+        patches = {}
+        for entry in self.patches.entries:
+            state = target.patches.get(entry.name)
+            if state is None or state.entry.definition != entry.definition:
+                state = PatchState(entry)
+                self.schedule_patch(target, state, now)
+            patches[entry.name] = state
+        target.patches = patches
+        self.publish_patch_stats()
+
+        keys = {entry.key for entry in self.patches.entries}
+        for key in list(target.resolvers):
+            if key not in keys:
+                del target.resolvers[key]
+
+    def get_patch_chain(self, target, entry):
+        if entry.signature:
+            module = entry.base_chain.module
+            regions = tuple(self.refresh_maps(target.pid).module_regions(module, 'x'))
+            key = (entry.signature, module)
+            cached = target.signatures.get(key)
+            if cached is None or cached[0] != regions:
+                cached = (regions, self.find_pointer_offset(target.pid, entry.signature, module))
+                target.signatures[key] = cached
+            if cached[1] > 0:
+                return entry.base_chain.with_root(cached[1])
+        return entry.base_chain
+
+    def resolve_patch(self, target, entry):
+        resolver = target.resolvers.get(entry.key)
+        if resolver is None:
+            chain = self.get_patch_chain(target, entry)
+            resolver = ChainResolver(chain, self, target.pid)
+            resolver.provisional = bool(entry.signature) and chain is entry.base_chain
+            target.resolvers[entry.key] = resolver
+        start = time.perf_counter()
+        moves = resolver.moves
+        address = resolver.resolve()
+        self.metrics.observe("resolve", start, bool(address))
+        if resolver.moves != moves:
+            self.metrics.count("pointer_moves")
+            self.log.emit("info", "pointer_moved", pid=target.pid, chain=str(resolver.chain), address=address)
+        if not address and resolver.provisional:
+            del target.resolvers[entry.key]
+        return address
+
+    def apply_patches(self, target, states):
+        resolved = {}
+        due = []
+        unresolved = 0
+        for state in states:
+            entry = state.entry
+            if entry.key not in resolved:
+                resolved[entry.key] = self.resolve_patch(target, entry)
+            state.address = resolved[entry.key] and resolved[entry.key] + entry.offset
+            if state.address != state.stats.address:
+                if state.address:
+                    self.log.emit("info", "patch_resolved", pid=target.pid, name=entry.name, address=state.address)
+                else:
+                    self.log.emit("warning", "patch_unresolved", pid=target.pid, name=entry.name)
+            state.stats.track(state.address)
+            if not state.address:
+                if entry.mode != "lobby":
+                    unresolved += 1
+            elif entry.mode != "once" or state.applied != state.address:
+                due.append(state)
+
+        current = self.read_memory_batch(target.pid, [(state.address, len(state.entry.data)) for state in due]) if due else []
+        results = {}
+        writes = []
+        for state, data in zip(due, current):
+            if state.entry.mode == "lobby":
+                if data is not None:
+                    target.phase = "lobby" if data == state.entry.data else "match"
+            elif data is None:
+                results[state] = None
+            elif data == state.entry.data:
+                results[state] = False
+            else:
+                writes.append(state)
+        if writes:
+            written = self.write_memory_batch(target.pid, [(state.address, state.entry.data) for state in writes])
+            for state, ok in zip(writes, written):
+                results[state] = True if ok else None
+
+        for state, result in results.items():
+            state.result = result
+            state.stats.record(result)
+            if result is None:
+                self.metrics.count("patch_failures")
             else:
-                self.status_changed.emit(LANG["status_error_enabling_ai"][current_language], False)
+                state.applied = state.address
+                if result:
+                    self.metrics.count("patch_writes")
+                    self.log.emit("info", "patch_written", pid=target.pid, name=state.entry.name,
+                                  address=state.address)
+        return unresolved, list(results.values())
+
+    def sample_values(self, now):
+        for target in self.targets.values():
+            states = [state for state in target.patches.values()
+                      if state.address and state.entry.type in PATCH_TYPES]
+            if not states:
+                continue
+            values = self.read_memory_batch(target.pid, [(state.address, len(state.entry.data)) for state in states])
+            for state, data in zip(states, values):
+                if data is not None:
+                    self.recorder.record(target.pid, state.entry, now, data)
+
+    def service_target(self, target, states=None):
+        self.metrics.count("ticks")
+        states = list(target.patches.values()) if states is None else states
+        phase = target.phase
+        unresolved, results = self.apply_patches(target, states)
+        if target.phase != phase:
+            self.log.emit("info", "phase_changed", pid=target.pid, phase=target.phase)
+        if target.phase != phase and target.phase == "lobby":
+            self.expedite_patches(target, states, time.monotonic())
+        if all(state.entry.mode == "lobby" for state in states):
+            return
+
+        if results and not target.found:
+            target.found = True
+            self.notify("status_sh2_found", True, pid=target.pid)
+
+        if unresolved:
+            target.active = False
+            self.notify("status_failed_to_get_ai_address", False)
+        elif None in results:
+            target.active = False
+            self.notify("status_error_enabling_ai", False)
+        elif True in results:
+            target.active = True
+            self.last_status = (LANG["status_ai_active"][current_language], True)
+            self.ai_enabled.emit()
+        elif not target.active:
+            target.active = True
+            self.notify("status_ai_active", True)
+
+    def run(self):
+        self.running = not self.stopping.is_set()
+        if not self.running:
+            return
+        self.last_status = None
+        if not self.load_patches() or not self.connect_helper():
+            self.log.drain()
+            return
+        loop = asyncio.new_event_loop()
+        self.loop = loop
+        try:
+            loop.run_until_complete(self.run_loop())
+        except OSError as e:
+            self.log.emit("error", "worker_failed", error=str(e))
+            self.error_occurred.emit(str(e))
+        finally:
+            for pid in list(self.targets):
+                self.remove_target(pid)
+            self.schedule = []
+            self.memory.close_all()
+            self.close_connector()
+            self.close_helper()
+            self.loop = None
+            loop.close()
+            self.log.drain()
+
+    async def run_loop(self):
+        self.open_connector()
+        self.sync_targets()
+        next_scan = time.monotonic() + DETECT_INTERVAL
+        next_sample = time.monotonic()
 
-            time.sleep(1)
+        while self.running:
+            self.report_waiting()
+            now = time.monotonic()
+
+            if now >= next_scan:
+                self.reload_patches()
+                if self.needs_polling():
+                    self.sync_targets()
+                next_scan = now + DETECT_INTERVAL
+
+            for target, states in self.pop_due_patches(now).items():
+                if not self.running:
+                    break
+                self.service_target(target, states)
+                self.reschedule_patches(target, states, time.monotonic())
+
+            sampling = self.recorder is not None and self.recorder.active
+            if sampling and now >= next_sample:
+                self.sample_values(now)
+                next_sample = max(next_sample + self.recorder.interval, now)
+
+            deadline = next_scan if self.needs_polling() else now + DETECT_INTERVAL
+            if self.schedule:
+                deadline = min(deadline, self.schedule[0][0])
+            if sampling and self.targets:
+                deadline = min(deadline, next_sample)
+            self.log.drain()
+            if await self.wait_events(deadline - time.monotonic()):
+                self.sync_targets()
+
+    def run_once(self):
+        if not self.load_patches() or not self.connect_helper():
+            self.log.drain()
+            return {}
+        try:
+            self.sync_targets()
+            results = {}
+            for pid, target in self.targets.items():
+                self.service_target(target)
+                results[pid] = target.active
+            return results
+        finally:
+            for pid in list(self.targets):
+                self.remove_target(pid)
+            self.schedule = []
+            self.memory.close_all()
+            self.close_helper()
+            self.log.drain()
+
+    def start(self):
+        self.running = True
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def wait(self):
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def wake_threadsafe(self):
+        loop = self.loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self.wake)
+            except RuntimeError:
+                pass
 
     def stop(self):
         self.running = False
+        self.stopping.set()
+        self.wake_threadsafe()
 
 LANG = {
     "app_title": {
@@ -195,6 +2558,98 @@ LANG = {
         "uk": "Про програму",
         "ru": "О программе"
     },
+    "tab_log": {
+        "en": "Log",
+        "uk": "Журнал",
+        "ru": "Журнал"
+    },
+    "tab_metrics": {
+        "en": "Metrics",
+        "uk": "Метрики",
+        "ru": "Метрики"
+    },
+    "metrics_headers": {
+        "en": ["Stage", "Calls", "Avg", "p50", "p95", "Max", "Errors"],
+        "uk": ["Етап", "Виклики", "Сер.", "p50", "p95", "Макс.", "Помилки"],
+        "ru": ["Этап", "Вызовы", "Сред.", "p50", "p95", "Макс.", "Ошибки"]
+    },
+    "metrics_patch_headers": {
+        "en": ["Patch", "PID", "Checks", "Writes", "Resets", "Failures", "Avg uncorrected", "Max uncorrected"],
+        "uk": ["Патч", "PID", "Перевірки", "Записи", "Скидання", "Помилки", "Сер. без виправлення",
+               "Макс. без виправлення"],
+        "ru": ["Патч", "PID", "Проверки", "Записи", "Сбросы", "Ошибки", "Сред. без исправления",
+               "Макс. без исправления"]
+    },
+    "metrics_summary": {
+        "en": "Ticks: {ticks}   Patch writes: {patch_writes}   Patch failures: {patch_failures}   Games: {targets}",
+        "uk": "Тіки: {ticks}   Записів патчу: {patch_writes}   Помилок патчу: {patch_failures}   Ігор: {targets}",
+        "ru": "Тики: {ticks}   Записей патча: {patch_writes}   Ошибок патча: {patch_failures}   Игр: {targets}"
+    },
+    "status_patch_table_error": {
+        "en": "❌ Patch table error: {}",
+        "uk": "❌ Помилка таблиці патчів: {}",
+        "ru": "❌ Ошибка таблицы патчей: {}"
+    },
+    "history_label": {
+        "en": "📈 Value history",
+        "uk": "📈 Історія значень",
+        "ru": "📈 История значений"
+    },
+    "button_export_history": {
+        "en": "💾 Export History",
+        "uk": "💾 Експорт історії",
+        "ru": "💾 Экспорт истории"
+    },
+    "export_history_filter": {
+        "en": "CSV files (*.csv);;Binary recordings (*.sh2r)",
+        "uk": "Файли CSV (*.csv);;Бінарні записи (*.sh2r)",
+        "ru": "Файлы CSV (*.csv);;Бинарные записи (*.sh2r)"
+    },
+    "status_history_exported": {
+        "en": "💾 Value history saved to {path}",
+        "uk": "💾 Історію значень збережено у {path}",
+        "ru": "💾 История значений сохранена в {path}"
+    },
+    "scan_started": {
+        "en": "🔎 Snapshot of PID {pid}: {count} candidate values",
+        "uk": "🔎 Знімок PID {pid}: {count} значень-кандидатів",
+        "ru": "🔎 Снимок PID {pid}: {count} значений-кандидатов"
+    },
+    "scan_help": {
+        "en": "Commands: c(hanged), u(nchanged), = N (or just N), l(ist) [count], r(eset), q(uit)",
+        "uk": "Команди: c(hanged) — змінилося, u(nchanged) — не змінилося, = N (або просто N), l(ist) [кількість], r(eset) — новий знімок, q(uit) — вихід",
+        "ru": "Команды: c(hanged) — изменилось, u(nchanged) — не изменилось, = N (или просто N), l(ist) [количество], r(eset) — новый снимок, q(uit) — выход"
+    },
+    "scan_candidates": {
+        "en": "{count} candidates left",
+        "uk": "Залишилось кандидатів: {count}",
+        "ru": "Осталось кандидатов: {count}"
+    },
+    "scan_unknown_command": {
+        "en": "Unknown command: {}",
+        "uk": "Невідома команда: {}",
+        "ru": "Неизвестная команда: {}"
+    },
+    "pointer_scan_map": {
+        "en": "🗺️ Pointer map: {count} pointers ({seconds:.1f} s)",
+        "uk": "🗺️ Карта вказівників: {count} вказівників ({seconds:.1f} с)",
+        "ru": "🗺️ Карта указателей: {count} указателей ({seconds:.1f} с)"
+    },
+    "pointer_scan_found": {
+        "en": "🔗 {count} pointer paths found ({seconds:.1f} s)",
+        "uk": "🔗 Знайдено шляхів: {count} ({seconds:.1f} с)",
+        "ru": "🔗 Найдено путей: {count} ({seconds:.1f} с)"
+    },
+    "pointer_scan_verified": {
+        "en": "✅ {count} paths still valid after {delay:g} s",
+        "uk": "✅ Через {delay:g} с дійсних шляхів: {count}",
+        "ru": "✅ Через {delay:g} с действительных путей: {count}"
+    },
+    "snapshot_captured": {
+        "en": "💾 Snapshot of PID {pid} saved to {path}: {regions} regions, {size:.1f} MiB",
+        "uk": "💾 Знімок PID {pid} збережено у {path}: регіонів {regions}, {size:.1f} МіБ",
+        "ru": "💾 Снимок PID {pid} сохранён в {path}: регионов {regions}, {size:.1f} МиБ"
+    },
     "title_main": {
         "en": "🏰 Stronghold 2 AI Enabler",
         "uk": "🏰 Stronghold 2 AI Enabler",
@@ -306,6 +2761,11 @@ LANG = {
         "uk": "🤖 AI активний у мультиплеєрі!",
         "ru": "🤖 AI активен в мультиплеере!"
     },
+    "status_headless_not_root": {
+        "en": "⚠️ Not running as root, memory access to the game may be denied",
+        "uk": "⚠️ Запущено без прав root, доступ до пам'яті гри може бути заборонено",
+        "ru": "⚠️ Запущено без прав root, доступ к памяти игры может быть запрещён"
+    },
     "language_label": {
         "en": "Language:",
         "uk": "Мова:",
@@ -315,476 +2775,190 @@ LANG = {
 
 current_language = "en"
 
-class Stronghold2GUI(QMainWindow):
-
-    def __init__(self):
-        super().__init__()
-        self.worker = None
-        self.ai_count = 0
-        self.init_ui()
-        self.setup_tray()
-        self.check_root_privileges()
-        self.update_ui_language()
-
-    def init_ui(self):
-        self.setWindowTitle(LANG["app_title"][current_language])
-        self.setMinimumSize(600, 500)
-
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2c3e50, stop: 1 #34495e);
-            }
-            QWidget {
-                background: transparent;
-                color: #ecf0f1;
-                font-family: 'Segoe UI', 'Ubuntu', sans-serif;
-            }
-            QTabWidget::pane {
-                border-top: 2px solid #3498db;
-                border-radius: 10px;
-                background: rgba(44, 62, 80, 0.7);
-            }
-            QTabBar::tab {
-                background: #34495e;
-                border: 2px solid #2c3e50;
-                border-bottom-color: #3498db;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 10px 15px;
-                color: #ecf0f1;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background: #3498db;
-                border-color: #3498db;
-                border-bottom-color: #3498db;
-                margin-bottom: -2px;
-            }
-            QTabBar::tab:hover {
-                background: #3fb4f3;
-            }
-        """)
-
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-
-        language_layout = QHBoxLayout()
-        self.language_label = QLabel(LANG["language_label"][current_language])
-        self.language_label.setStyleSheet("color: #ecf0f1; font-size: 14px;")
-        language_layout.addWidget(self.language_label)
-
-        self.language_combo = QComboBox()
-        self.language_combo.addItem("English", "en")
-        self.language_combo.addItem("Українська", "uk")
-        self.language_combo.addItem("Русский", "ru")
-        self.language_combo.currentIndexChanged.connect(self.change_language)
-        self.language_combo.setCurrentIndex(self.language_combo.findData("en"))
-
-        self.language_combo.setStyleSheet("""
-            QComboBox {
-                background: #34495e;
-                border: 1px solid #2c3e50;
-                border-radius: 5px;
-                padding: 5px;
-                color: #ecf0f1;
-                min-width: 100px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAcAAAAECAYAAADtTWMxAAAAAXNSR0IArs4c6QAAADFJREFUCJljYGBgeP///38gWzABoGNgYGAg2RkYQPiFgX0Ggg+FGBgQCJtBwAgAUv8F/R0s/WwAAAAASUVORK5CYII=);
-                width: 10px;
-                height: 10px;
-            }
-            QComboBox QAbstractItemView {
-                background: #34495e;
-                border: 1px solid #2c3e50;
-                selection-background-color: #3498db;
-                color: #ecf0f1;
-            }
-        """)
-        language_layout.addWidget(self.language_combo)
-        language_layout.addStretch()
-        main_layout.addLayout(language_layout)
-
-        self.tabs = QTabWidget()
-        self.tabs.tabBar().setExpanding(True)
-        self.tabs.setStyleSheet("""
-            QTabWidget {
-                border-radius: 10px;
-            }
-        """)
-        main_layout.addWidget(self.tabs)
-
-        self.create_status_tab()
-        self.create_about_tab()
-
-        main_layout.addStretch()
-
-    def create_status_tab(self):
-        status_tab = QWidget()
-        status_layout = QVBoxLayout(status_tab)
-        status_layout.setSpacing(25)
-        status_layout.setContentsMargins(30, 20, 30, 20)
-
-        self.title_label = QLabel(LANG["title_main"][current_language])
-        self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                font-size: 28px;
-                font-weight: bold;
-                color: #3498db;
-                padding: 25px;
-                border-bottom: 3px solid #3498db;
-                margin-bottom: 15px;
-                background: rgba(52, 152, 219, 0.1);
-                border-radius: 10px;
-            }
-        """)
-        status_layout.addWidget(self.title_label)
-
-        self.status_label = QLabel(LANG["status_initial"][current_language])
-        self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background: rgba(149, 165, 166, 0.2);
-                border: 2px solid #95a5a6;
-                border-radius: 12px;
-                padding: 20px;
-                font-size: 18px;
-                font-weight: bold;
-                color: #ecf0f1;
-                min-height: 40px;
-            }
-        """)
-        status_layout.addWidget(self.status_label)
-
-        self.counter_label = QLabel(LANG["ai_counter"][current_language].format(self.ai_count))
-        self.counter_label.setAlignment(Qt.AlignCenter)
-        self.counter_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                color: #bdc3c7;
-                padding: 15px;
-                background: rgba(127, 140, 141, 0.1);
-                border-radius: 8px;
-                margin: 10px 0;
-            }
-        """)
-        status_layout.addWidget(self.counter_label)
-
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(20)
-
-        self.start_button = QPushButton(LANG["button_start"][current_language])
-        self.start_button.clicked.connect(self.start_monitoring)
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #27ae60, stop: 1 #2ecc71);
-                border: none;
-                color: white;
-                padding: 15px 25px;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: bold;
-                min-width: 180px;
-                min-height: 50px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2ecc71, stop: 1 #27ae60);
-                transform: translateY(-2px);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #229954, stop: 1 #27ae60);
-            }
-            QPushButton:disabled {
-                background: #7f8c8d;
-                color: #bdc3c7;
-            }
-        """)
-        buttons_layout.addWidget(self.start_button)
-
-        self.stop_button = QPushButton(LANG["button_stop"][current_language])
-        self.stop_button.clicked.connect(self.stop_monitoring)
-        self.stop_button.setEnabled(False)
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #e74c3c, stop: 1 #c0392b);
-                border: none;
-                color: white;
-                padding: 15px 25px;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: bold;
-                min-width: 180px;
-                min-height: 50px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #ec7063, stop: 1 #e74c3c);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #c0392b, stop: 1 #a93226);
-            }
-            QPushButton:disabled {
-                background: #7f8c8d;
-                color: #bdc3c7;
-            }
-        """)
-        buttons_layout.addWidget(self.stop_button)
-
-        status_layout.addLayout(buttons_layout)
-        status_layout.addStretch()
-
-        self.tabs.addTab(status_tab, LANG["tab_status"][current_language])
-
-    def create_about_tab(self):
-        about_tab = QWidget()
-        about_layout = QVBoxLayout(about_tab)
-        about_layout.setSpacing(20)
-        about_layout.setContentsMargins(30, 20, 30, 20)
-
-        about_label = QLabel(LANG["about_text"][current_language])
-        about_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        about_label.setWordWrap(True)
-        about_label.setStyleSheet("""
-            QLabel {
-                background: rgba(52, 73, 94, 0.4);
-                border: 2px solid #5d6d7e;
-                border-radius: 12px;
-                padding: 20px;
-                font-size: 14px;
-                color: #bdc3c7;
-                line-height: 1.4;
-            }
-        """)
-        about_layout.addWidget(about_label)
-        about_layout.addStretch()
-
-        self.tabs.addTab(about_tab, LANG["tab_about"][current_language])
-        self.about_label = about_label
-
-    def change_language(self, index):
-        global current_language
-        current_language = self.language_combo.itemData(index)
-        self.update_ui_language()
-
-    def update_ui_language(self):
-        self.setWindowTitle(LANG["app_title"][current_language])
-        self.language_label.setText(LANG["language_label"][current_language])
-        self.title_label.setText(LANG["title_main"][current_language])
-        self.status_label.setText(LANG["status_initial"][current_language])
-        self.counter_label.setText(LANG["ai_counter"][current_language].format(self.ai_count))
-        self.start_button.setText(LANG["button_start"][current_language])
-        self.stop_button.setText(LANG["button_stop"][current_language])
-        self.about_label.setText(LANG["about_text"][current_language])
-
-        self.tabs.setTabText(0, LANG["tab_status"][current_language])
-        self.tabs.setTabText(1, LANG["tab_about"][current_language])
-
-        if hasattr(self, 'tray_icon'):
-            self.tray_icon.setToolTip(LANG["tray_icon_tooltip"][current_language])
-            tray_menu = self.tray_icon.contextMenu()
-            if tray_menu:
-                show_action = tray_menu.actions()[0]
-                quit_action = tray_menu.actions()[1]
-                show_action.setText(LANG["tray_show_window"][current_language])
-                quit_action.setText(LANG["tray_quit_app"][current_language])
-
-
-    def setup_tray(self):
-        if QSystemTrayIcon.isSystemTrayAvailable():
-            self.tray_icon = QSystemTrayIcon(self)
-
-            pixmap = QPixmap(32, 32)
-            pixmap.fill(QColor(52, 152, 219))
-            painter = QPainter(pixmap)
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(pixmap.rect(), Qt.AlignCenter, "SH2")
-            painter.end()
-
-            self.tray_icon.setIcon(QIcon(pixmap))
-            self.tray_icon.setToolTip(LANG["tray_icon_tooltip"][current_language])
-
-            tray_menu = QMenu()
-
-            show_action = QAction(LANG["tray_show_window"][current_language], self)
-            show_action.triggered.connect(self.show_window)
-            tray_menu.addAction(show_action)
-
-            quit_action = QAction(LANG["tray_quit_app"][current_language], self)
-            quit_action.triggered.connect(self.quit_app)
-            tray_menu.addAction(quit_action)
-
-            self.tray_icon.setContextMenu(tray_menu)
-            self.tray_icon.activated.connect(self.tray_activated)
-            self.tray_icon.show()
-
-    def show_window(self):
-        self.show()
-        self.raise_()
-        self.activateWindow()
-
-    def quit_app(self):
-        if self.worker:
-            self.worker.stop()
-            self.worker.wait()
-        QApplication.quit()
-
-    def tray_activated(self, reason):
-        if reason == QSystemTrayIcon.DoubleClick:
-            self.show_window()
-
-    def check_root_privileges(self):
-        if os.geteuid() != 0:
-            self.set_status(LANG["status_acquiring_root"][current_language], False)
-            QApplication.processEvents()
-
-            try:
-                current_script = os.path.abspath(__file__)
-                subprocess.Popen([
-                    'pkexec', 'python3', current_script
-                ])
-                sys.exit(0)
-            except Exception as e:
-                self.set_status(LANG["status_root_error"][current_language].format(e), False)
-        else:
-            self.set_status(LANG["status_root_acquired"][current_language], True)
-
-    def set_status(self, message, is_success=None):
-        self.status_label.setText(message)
-
-        if is_success is True:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    background: rgba(39, 174, 96, 0.3);
-                    border: 2px solid #27ae60;
-                    border-radius: 12px;
-                    padding: 20px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #2ecc71;
-                    min-height: 40px;
-                }
-            """)
-        elif is_success is False:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    background: rgba(231, 76, 60, 0.3);
-                    border: 2px solid #e74c3c;
-                    border-radius: 12px;
-                    padding: 20px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #e74c3c;
-                    min-height: 40px;
-                }
-            """)
-        else:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    background: rgba(149, 165, 166, 0.2);
-                    border: 2px solid #95a5a6;
-                    border-radius: 12px;
-                    padding: 20px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #ecf0f1;
-                    min-height: 40px;
-                }
-            """)
-
-    def start_monitoring(self):
-        self.worker = Stronghold2Worker()
-        self.worker.status_changed.connect(self.update_status)
-        self.worker.ai_enabled.connect(self.ai_activated)
-        self.worker.error_occurred.connect(self.handle_error)
-
-        self.worker.start()
-
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
-        self.ai_count = 0
-        self.update_counter()
-
-    def stop_monitoring(self):
-        if self.worker:
-            self.worker.stop()
-            self.worker.wait()
-            self.worker = None
-
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
-        self.set_status(LANG["status_monitoring_stopped"][current_language])
-
-    def update_status(self, message, is_success):
-        self.set_status(message, is_success)
-        if hasattr(self, 'tray_icon'):
-            self.tray_icon.setToolTip(f"{LANG['tray_icon_tooltip'][current_language]} - {message}")
-
-    def ai_activated(self):
-        self.ai_count += 1
-        self.update_counter()
-        self.set_status(LANG["status_ai_active"][current_language], True)
-
-    def update_counter(self):
-        self.counter_label.setText(LANG["ai_counter"][current_language].format(self.ai_count))
-
-    def handle_error(self, error):
-        self.set_status(LANG["status_error"][current_language].format(error), False)
-
-    def closeEvent(self, event):
-        if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
-            self.hide()
-            if hasattr(self, 'tray_icon'):
-                self.tray_icon.showMessage(
-                    LANG["tray_minimize_message_title"][current_language],
-                    LANG["tray_minimize_message_text"][current_language],
-                    QSystemTrayIcon.Information,
-                    3000
-                )
-            event.ignore()
-        else:
-            if self.worker:
-                self.worker.stop()
-                self.worker.wait()
-            event.accept()
+def run_headless(once, metrics_port=None, patch_path=None, record_path=None, record_rate=RECORDER_RATE,
+                 snapshot_path=None, log_path=None):
+    recorder = ValueRecorder(record_rate) if record_path and not once else None
+    log = EventLog(log_path)
+    worker = Stronghold2Worker(patch_path=patch_path, recorder=recorder, snapshot_path=snapshot_path, log=log)
+    if metrics_port and not once:
+        serve_metrics(worker.metrics, metrics_port)
+    worker.status_changed.connect(lambda message, is_success: print(message, flush=True))
+    worker.ai_enabled.connect(lambda: print(LANG["status_ai_active"][current_language], flush=True))
+    worker.error_occurred.connect(lambda error: print(LANG["status_error"][current_language].format(error), flush=True))
+
+    if os.geteuid() != 0:
+        print(LANG["status_headless_not_root"][current_language], file=sys.stderr, flush=True)
+
+    if once:
+        results = worker.run_once()
+        log.close()
+        if not results:
+            print(LANG["status_waiting_for_sh2"][current_language], flush=True)
+        return 0 if results and all(results.values()) else 1
+
+    signal.signal(signal.SIGINT, lambda s, f: worker.stop())
+    signal.signal(signal.SIGTERM, lambda s, f: worker.stop())
+    worker.run()
+    log.close()
+    if recorder is not None:
+        recorder.export(record_path)
+        print(LANG["status_history_exported"][current_language].format(path=record_path), flush=True)
+    return 0
+
+def run_capture(path, pid=None):
+    worker = Stronghold2Worker(use_proc_connector=False)
+    pid = pid or worker.find_stronghold_pid()
+    if not pid:
+        print(LANG["status_waiting_for_sh2"][current_language], flush=True)
+        return 1
+    regions, size = capture_snapshot(worker, pid, path)
+    worker.memory.close_all()
+    print(LANG["snapshot_captured"][current_language].format(
+        pid=pid, path=path, regions=regions, size=size / (1 << 20)), flush=True)
+    return 0
+
+def run_scanner(size, pid=None, snapshot_path=None):
+    worker = Stronghold2Worker(use_proc_connector=False, snapshot_path=snapshot_path)
+    pid = pid or worker.find_stronghold_pid()
+    if not pid:
+        print(LANG["status_waiting_for_sh2"][current_language], flush=True)
+        return 1
+
+    scanner = ValueScanner(worker, pid, size)
+    print(LANG["scan_started"][current_language].format(pid=pid, count=scanner.start()), flush=True)
+    print(LANG["scan_help"][current_language], flush=True)
+
+    while True:
+        try:
+            line = input("> ").strip()
+        except EOFError:
+            break
+        command, _, argument = line.partition(' ')
+        try:
+            if command in ('q', 'quit'):
+                break
+            elif command in ('c', 'changed'):
+                count = scanner.narrow("changed")
+            elif command in ('u', 'unchanged'):
+                count = scanner.narrow("unchanged")
+            elif command == '=' or command.lstrip('-').isdigit() or command.startswith('0x'):
+                count = scanner.narrow("equal", int(argument if command == '=' else command, 0))
+            elif command in ('r', 'reset'):
+                count = scanner.start()
+            elif command in ('l', 'list'):
+                addresses = scanner.addresses(int(argument or SCAN_LIST_LIMIT))
+                values = worker.read_memory_batch(pid, [(address, size) for address in addresses])
+                for address, data in zip(addresses, values):
+                    value = int.from_bytes(data, 'little') if data else '?'
+                    print(f"{scanner.describe(address)}  = {value}")
+                continue
+            elif command:
+                print(LANG["scan_unknown_command"][current_language].format(command))
+                continue
+            else:
+                continue
+        except ValueError as e:
+            print(LANG["status_error"][current_language].format(e))
+            continue
+        print(LANG["scan_candidates"][current_language].format(count=count), flush=True)
+
+    worker.memory.close_all()
+    return 0
+
+def run_pointer_scan(target, pid=None, max_depth=POINTER_SCAN_DEPTH, max_offset=POINTER_SCAN_OFFSET,
+                     verify_delay=POINTER_SCAN_VERIFY_DELAY, snapshot_path=None):
+    worker = Stronghold2Worker(use_proc_connector=False, snapshot_path=snapshot_path)
+    pid = pid or worker.find_stronghold_pid()
+    if not pid:
+        print(LANG["status_waiting_for_sh2"][current_language], flush=True)
+        return 1
+
+    start = time.monotonic()
+    pointer_map = build_pointer_map(worker, pid)
+    if pointer_map is None:
+        print(LANG["status_failed_to_get_ai_address"][current_language], flush=True)
+        return 1
+    print(LANG["pointer_scan_map"][current_language].format(
+        count=len(pointer_map), seconds=time.monotonic() - start), flush=True)
+
+    start = time.monotonic()
+    paths = scan_pointer_paths(pointer_map, target, max_depth, max_offset)
+    print(LANG["pointer_scan_found"][current_language].format(
+        count=len(paths), seconds=time.monotonic() - start), flush=True)
+
+    if verify_delay > 0 and paths and snapshot_path is None:
+        time.sleep(verify_delay)
+        worker.maps.clear()
+        paths = verify_pointer_paths(worker, pid, paths, target)
+        print(LANG["pointer_scan_verified"][current_language].format(
+            count=len(paths), delay=verify_delay), flush=True)
+
+    for expression in paths[:SCAN_LIST_LIMIT]:
+        print(expression)
+    worker.memory.close_all()
+    return 0 if paths else 1
 
 def main():
-    app = QApplication(sys.argv)
-    app.setQuitOnLastWindowClosed(False)
-
-    app.setApplicationName("Stronghold 2 AI Enabler")
-    app.setApplicationVersion("2.0")
-    app.setOrganizationName("GameModders")
-
-    window = Stronghold2GUI()
-    window.show()
-
-    signal.signal(signal.SIGINT, lambda s, f: app.quit())
-    signal.signal(signal.SIGTERM, lambda s, f: app.quit())
-
-    print("🏰 Stronghold 2 AI Enabler v2.0 launched!")
-    print("   Use GUI to control or Ctrl+C to exit")
-
-    try:
-        sys.exit(app.exec_())
-    except KeyboardInterrupt:
-        print("\n⏹️ Program stopped by user")
-        if window.worker:
-            window.worker.stop()
-            window.worker.wait()
-        sys.exit(0)
+    global current_language
+
+    parser = argparse.ArgumentParser(description=LANG["tray_icon_tooltip"]["en"])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--headless', action='store_true', help="run the patch loop without the GUI")
+    mode.add_argument('--once', action='store_true', help="patch every running game once and exit")
+    mode.add_argument('--scan', action='store_true', help="interactively search the game's memory for an unknown value")
+    mode.add_argument('--pointer-scan', type=lambda text: int(text, 0), metavar='ADDRESS',
+                      help="find stable pointer paths from the game module to ADDRESS")
+    mode.add_argument('--capture', metavar='FILE', help="save the game's maps and writable memory to a snapshot file")
+    mode.add_argument('--helper', metavar='SOCKET', help="serve process discovery and memory I/O on a Unix socket")
+    parser.add_argument('--helper-parent', type=int, metavar='PID', help="exit the helper when this process exits")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="serve Prometheus metrics on 127.0.0.1:PORT/metrics")
+    parser.add_argument('--patches', metavar='FILE',
+                        help=f"patch table to apply (default: {os.path.basename(PATCH_TABLE_FILE)} next to this script)")
+    parser.add_argument('--record', metavar='FILE',
+                        help="with --headless, record patched values and save them on exit (.csv or binary)")
+    parser.add_argument('--record-rate', type=float, default=RECORDER_RATE, metavar='HZ',
+                        help="value history sampling rate")
+    parser.add_argument('--scan-size', type=int, choices=SCAN_VALUE_SIZES, default=1,
+                        help="value size in bytes for --scan")
+    parser.add_argument('--pid', type=int, help="game process for --scan and --pointer-scan (default: first one found)")
+    parser.add_argument('--max-depth', type=int, default=POINTER_SCAN_DEPTH, help="pointer levels for --pointer-scan")
+    parser.add_argument('--max-offset', type=lambda text: int(text, 0), default=POINTER_SCAN_OFFSET,
+                        help="largest offset per level for --pointer-scan")
+    parser.add_argument('--verify-delay', type=float, default=POINTER_SCAN_VERIFY_DELAY,
+                        help="seconds before re-checking found paths, 0 disables")
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help="read memory from a snapshot file instead of the live game (--once, --scan, --pointer-scan)")
+    parser.add_argument('--log', metavar='FILE',
+                        help="append structured events to FILE as JSON lines, rotating it at 1 MiB")
+    parser.add_argument('--lang', choices=sorted(LANG["app_title"]), default=current_language)
+    args = parser.parse_args()
+    current_language = args.lang
+
+    if args.helper:
+        uid = int(os.environ.get('PKEXEC_UID') or os.environ.get('SUDO_UID') or os.getuid())
+        signal.signal(signal.SIGTERM, lambda s, f: sys.exit(0))
+        HelperServer(args.helper, uid, args.helper_parent).serve()
+        return
+
+    if args.capture:
+        sys.exit(run_capture(args.capture, args.pid))
+
+    if args.scan:
+        sys.exit(run_scanner(args.scan_size, args.pid, args.snapshot))
+
+    if args.pointer_scan is not None:
+        sys.exit(run_pointer_scan(args.pointer_scan, args.pid, args.max_depth, args.max_offset, args.verify_delay,
+                                  args.snapshot))
+
+    if args.headless or args.once:
+        sys.exit(run_headless(args.once, args.metrics_port, args.patches, args.record, args.record_rate,
+                              args.snapshot, args.log))
+
+    sys.modules.setdefault("stronghold2_patcher", sys.modules[__name__])
+    import stronghold2_gui
+    stronghold2_gui.current_language = current_language
+    stronghold2_gui.main(args.metrics_port, args.patches, args.record_rate, args.log)
 
 if __name__ == "__main__":
     main()